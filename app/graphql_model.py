@@ -8,11 +8,15 @@
 Model to inject a another graphene model, to manage the haystack layer.
 See the `blueprint_graphql` to see how to integrate this part of global GraphQL model.
 """
-import json
+import importlib.util
+import inspect
+import keyword
 import logging
 import os
-from datetime import datetime, date, time
-from typing import Optional, List, Any, Union, Type, Dict, cast
+import re
+from datetime import datetime, date, time, timezone
+from functools import lru_cache
+from typing import Optional, List, Any, Union, Type, Dict, Callable, Tuple, cast
 
 import graphene
 import pytz
@@ -22,22 +26,102 @@ from graphql.language.ast import StringValue, IntValue, FloatValue, BooleanValue
 import shaystack
 from shaystack import Ref, Uri, Coordinate, parse_hs_datetime_format, Grid
 from shaystack.grid_filter import parse_hs_time_format, parse_hs_date_format
-from shaystack.providers.haystack_interface import get_singleton_provider, parse_date_range
+from shaystack.jsondumper import dump_scalar_to_jsonable
+from shaystack.providers.haystack_interface import HaystackInterface, get_singleton_provider, \
+    parse_date_range
 from shaystack.type import Entity
-# noinspection PyProtectedMember,PyProtectedMember,PyProtectedMember
-from shaystack.zincdumper import _dump_hs_date_time, _dump_hs_time, _dump_hs_date
+# noinspection PyProtectedMember
+from shaystack.zincdumper import _dump_hs_date_time
 
-BOTO3_AVAILABLE = False
-try:
-    # Check the presence of boto3
-    import boto3  # pylint: disable=unused-import
-
-    BOTO3_AVAILABLE = True
-except ImportError:
-    pass
+# Check the presence of boto3, without importing it
+BOTO3_AVAILABLE = importlib.util.find_spec("boto3") is not None
 
 log = logging.getLogger("shaystack")
 
+# Maximum number of parsed scalar strings kept for each type
+_PARSE_CACHE_SIZE = 4096
+# Maximum number of interned references for the entity ids
+_REF_CACHE_SIZE = 8192
+# Relative dates depend on the current day and must not be cached
+_RELATIVE_DATES = ("today", "yesterday")
+# The name of a haystack reference, like in `jsonparser.REF_RE`
+_REF_NAME_RE = re.compile(r'[a-zA-Z0-9_:\-.~]+')
+# The time zones dumped as "UTC" without a lookup in the haystack time zones
+_UTC_TZINFOS = (pytz.UTC, timezone.utc)
+
+
+def _provider() -> HaystackInterface:
+    """
+    Return the provider of the process, configured with the environment variables.
+    """
+    return get_singleton_provider(cast(Dict[str, str], os.environ))
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_hs_datetime(value: str) -> datetime:
+    """
+    Parse a haystack datetime.
+    Args:
+        value: The string to parse (with or without the `t:` prefix)
+    Returns:
+        The corresponding `datetime`
+    """
+    if value.startswith("t:"):
+        value = value[2:]
+    return parse_hs_datetime_format(value, pytz.UTC)
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_hs_date(value: str) -> date:
+    """
+    Parse a haystack date, with a fast path for the pure ISO-8601 shape.
+    Args:
+        value: The string to parse (with or without the `d:` prefix)
+    Returns:
+        The corresponding `date`
+    """
+    if value.startswith("d:"):
+        value = value[2:]
+    if len(value) == 10:
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            pass
+    return parse_hs_date_format(value)
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_hs_time(value: str) -> time:
+    """
+    Parse a haystack time, with a fast path for the pure ISO-8601 shape.
+    Args:
+        value: The string to parse (with or without the `h:` prefix)
+    Returns:
+        The corresponding `time`
+    """
+    if value.startswith("h:"):
+        value = value[2:]
+    if value[2:3] == ':':
+        try:
+            return time.fromisoformat(value)
+        except ValueError:
+            pass
+    return parse_hs_time_format(value)
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_hs_uri(value: str) -> Uri:
+    """
+    Parse a haystack uri.
+    Args:
+        value: The string to parse (with or without the `u:` prefix)
+    Returns:
+        The corresponding `Uri`
+    """
+    if value.startswith("u:"):
+        return shaystack.parse_scalar(value, shaystack.MODE_JSON, version=shaystack.VER_3_0)
+    return Uri(value)
+
 
 class HSScalar(graphene.Scalar):
     """Haystack Scalar"""
@@ -53,9 +137,7 @@ class HSScalar(graphene.Scalar):
         Args:
             hs_scalar: Any value
         """
-        return json.loads(shaystack.dump_scalar(hs_scalar,
-                                                shaystack.MODE_JSON,
-                                                version=shaystack.VER_3_0))
+        return dump_scalar_to_jsonable(hs_scalar, version=shaystack.VER_3_0)
 
     @staticmethod
     def parse_literal(node: Union[IntValue, FloatValue, StringValue, BooleanValue, EnumValue]) -> Any:
@@ -67,6 +149,14 @@ class HSScalar(graphene.Scalar):
         if isinstance(node, StringValue):
             str_value = node.value
             if len(str_value) >= 2 and str_value[1] == ':':
+                if '\\' not in str_value:  # Without escape, the common cases are direct
+                    kind = str_value[0]
+                    if kind == 's':
+                        return str_value[2:]
+                    if kind == 'r':
+                        name, sep, dis = str_value[2:].partition(' ')
+                        if _REF_NAME_RE.fullmatch(name):
+                            return Ref(name, dis if sep else None)
                 return shaystack.parse_scalar(node.value,
                                               shaystack.MODE_JSON)
         return node.value
@@ -95,6 +185,9 @@ class HSDateTime(graphene.String):
         """
         assert isinstance(date_time, datetime), \
             'Received not compatible datetime "{}"'.format(repr(date_time))
+        if date_time.tzinfo in _UTC_TZINFOS:
+            # Fast path, without searching the haystack time zone name
+            return date_time.isoformat() + " UTC"
         return _dump_hs_date_time(date_time)
 
     @staticmethod
@@ -120,7 +213,9 @@ class HSDateTime(graphene.String):
             return value
         if isinstance(value, date):
             return datetime.combine(value, datetime.max.time()).replace(tzinfo=pytz.UTC)
-        return parse_hs_datetime_format(value, pytz.UTC)
+        if value in _RELATIVE_DATES:
+            return parse_hs_datetime_format(value, pytz.UTC)
+        return _parse_hs_datetime(value)
 
 
 class HSDate(graphene.String):
@@ -137,7 +232,7 @@ class HSDate(graphene.String):
             a_date: A date
         """
         assert isinstance(a_date, date), 'Received not compatible date "{}"'.format(repr(a_date))
-        return _dump_hs_date(a_date)
+        return a_date.isoformat()
 
     @staticmethod
     def parse_literal(node: StringValue) -> date:  # pylint: disable=arguments-differ
@@ -158,7 +253,7 @@ class HSDate(graphene.String):
         """
         if isinstance(value, date):
             return value
-        return parse_hs_date_format(value)
+        return _parse_hs_date(value)
 
 
 class HSTime(graphene.String):
@@ -175,7 +270,7 @@ class HSTime(graphene.String):
             a_time: The time.
         """
         assert isinstance(a_time, time), 'Received not compatible time "{}"'.format(repr(a_time))
-        return _dump_hs_time(a_time)
+        return a_time.isoformat()
 
     @staticmethod
     def parse_literal(node: StringValue) -> time:  # pylint: disable=arguments-differ
@@ -195,7 +290,7 @@ class HSTime(graphene.String):
         """
         if isinstance(value, time):
             return value
-        return parse_hs_time_format(value)
+        return _parse_hs_time(value)
 
 
 class HSUri(graphene.String):
@@ -230,9 +325,7 @@ class HSUri(graphene.String):
         Args:
             value: The string
         """
-        if value.startswith("u:"):
-            return shaystack.parse_scalar(value, shaystack.MODE_JSON, version=shaystack.VER_3_0)
-        return Uri(value)
+        return _parse_hs_uri(value)
 
 
 class HSCoordinate(graphene.ObjectType):  # pylint: disable=too-few-public-methods
@@ -300,6 +393,128 @@ class HSPointWrite(graphene.ObjectType):  # pylint: disable=too-few-public-metho
     who = graphene.String(description="Who has updated the value")
 
 
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _conv_action(name: str, value_type: type) -> Optional[Callable[[Any], Any]]:
+    """
+    Select how to convert a value of a time series to the selected `HSTS` field.
+    Args:
+        name: The selected field
+        value_type: The type of the value
+    Returns:
+        The conversion to apply, or `None` if this field is not compatible with the value.
+    """
+    # pylint: disable=too-many-return-statements
+    if name == 'int' and issubclass(value_type, (int, float)):
+        return int
+    if name == 'float' and issubclass(value_type, float):
+        return _identity
+    if name == 'str':
+        return str
+    if name == 'bool':
+        return bool
+    if name == 'uri' and issubclass(value_type, Uri):
+        return str
+    if name == 'ref' and issubclass(value_type, Ref):
+        return lambda value: '@' + value.name
+    if name == 'date' and issubclass(value_type, date):  # Include datetime
+        return _identity
+    if name == 'time' and issubclass(value_type, time):
+        return _identity
+    if name == 'time' and issubclass(value_type, datetime):
+        return lambda value: value.time()
+    if name == 'datetime' and issubclass(value_type, datetime):
+        return _identity
+    if name == 'coord' and issubclass(value_type, Coordinate):
+        return lambda value: HSCoordinate(value.latitude, value.longitude)
+    return None
+
+
+@lru_cache(maxsize=128)
+def _value_converter(names: Tuple[str, ...], value_type: type) -> Callable[[datetime, Any], HSTS]:
+    """
+    Specialize the conversion of a time series value to `HSTS`, for a type of value.
+    The compatible fields are selected only once.
+    Args:
+        names: The selected fields
+        value_type: The type of the values
+    Returns:
+        The function to convert a (ts, val) to `HSTS`
+    """
+    actions = tuple((name, action) for name, action in
+                    ((name, _conv_action(name, value_type)) for name in names)
+                    if action)
+
+    def _conv(date_time: datetime, value: Any) -> HSTS:
+        cast_value = HSTS()
+        cast_value.ts = date_time  # pylint: disable=invalid-name
+        cast_value.val = value
+        for name, action in actions:
+            setattr(cast_value, name, action(value))
+        return cast_value
+
+    return _conv
+
+
+@lru_cache(maxsize=_REF_CACHE_SIZE)
+def _id_to_ref(entity_id: str) -> Ref:
+    """
+    Convert a GraphQL id (`r:xxx`, `@xxx` or `xxx`) to a `Ref`.
+    The same id is converted only once.
+    Args:
+        entity_id: The id
+    Returns:
+        The reference
+    """
+    return Ref(entity_id[2:] if entity_id[:2] == "r:" else
+               entity_id[1:] if entity_id[:1] == '@' else entity_id)
+
+
+def _has_plain_attributes(target_class: Type, keys: Tuple[str, ...]) -> bool:
+    """
+    Check if the attributes of a `target_class` instance can be set directly in its `__dict__`.
+    Args:
+        target_class: The graphene class to instantiate
+        keys: The attribute names
+    Returns:
+        False if the class use `__slots__` or data descriptors for these attributes
+    """
+    if not hasattr(target_class(), "__dict__"):
+        return False
+    return not any(hasattr(type(inspect.getattr_static(target_class, key, None)), "__set__")
+                   for key in keys)
+
+
+@lru_cache(maxsize=128)
+def _entity_builder(target_class: Type, keys: Tuple[str, ...]) -> Callable[[Entity], Any]:
+    """
+    Generate a function to convert an entity with these keys to a `target_class` instance.
+    The attributes are assigned with one `__dict__` update, or with straight-line code,
+    without a loop.
+    Args:
+        target_class: The graphene class to instantiate
+        keys: The keys of the entities
+    Returns:
+        The function to convert an entity
+    """
+    lines = ["def _build(entity):",
+             "  entity_result = target_class()"]
+    if _has_plain_attributes(target_class, keys):
+        lines.append("  entity_result.__dict__.update(entity)")
+    else:
+        for key in keys:
+            if key.isidentifier() and not keyword.iskeyword(key):
+                lines.append("  entity_result.%s = entity[%r]" % (key, key))
+            else:
+                lines.append("  setattr(entity_result, %r, entity[%r])" % (key, key))
+    lines.append("  return entity_result")
+    namespace = {"target_class": target_class}
+    exec("\n".join(lines), namespace)  # pylint: disable=exec-used
+    return namespace["_build"]
+
+
 # PPR: see the batch approach
 class ReadHaystack(graphene.ObjectType):
     """Ontology conform with Haystack project"""
@@ -364,8 +579,7 @@ class ReadHaystack(graphene.ObjectType):
     def resolve_about(parent: 'ReadHaystack',
                       info: ResolveInfo):
         log.debug("resolve_about(parent,info)")
-        envs = cast(Dict[str, str], os.environ)
-        grid = get_singleton_provider(envs).about("http://localhost")
+        grid = _provider().about("http://localhost")
         result = ReadHaystack._conv_entity(HSAbout, grid[0])
         result.serverTime = grid[0]["serverTime"]  # pylint: disable=invalid-name
         result.bootTime = grid[0]["serverBootTime"]  # pylint: disable=invalid-name, attribute-defined-outside-init
@@ -376,8 +590,7 @@ class ReadHaystack(graphene.ObjectType):
     def resolve_ops(parent: 'ReadHaystack',
                     info: ResolveInfo):
         log.debug("resolve_about(parent,info)")
-        envs = cast(Dict[str, str], os.environ)
-        grid = get_singleton_provider(envs).ops()
+        grid = _provider().ops()
         return ReadHaystack._conv_list_to_object_type(HSOps, grid)
 
     # noinspection PyUnusedLocal
@@ -387,16 +600,14 @@ class ReadHaystack(graphene.ObjectType):
                            tag: str,
                            version: Optional[HSDateTime] = None):
         log.debug("resolve_values(parent,info,%s)", tag)
-        envs = cast(Dict[str, str], os.environ)
-        return get_singleton_provider(envs).values_for_tag(tag, version)
+        return _provider().values_for_tag(tag, version)
 
     # noinspection PyUnusedLocal
     @staticmethod
     def resolve_versions(parent: 'ReadHaystack',
                          info: ResolveInfo):
         log.debug("resolve_versions(parent,info)")
-        envs = cast(Dict[str, str], os.environ)
-        return get_singleton_provider(envs).versions()
+        return _provider().versions()
 
     # noinspection PyShadowingBuiltins
     # noinspection PyUnusedLocal
@@ -413,9 +624,8 @@ class ReadHaystack(graphene.ObjectType):
             "select=%s, filter=%s, "
             "limit=%s, version=%s)", ids, select, filter, limit, version)
         if ids:
-            ids = [Ref(ReadHaystack._filter_id(entity_id)) for entity_id in ids]
-        envs = cast(Dict[str, str], os.environ)
-        grid = get_singleton_provider(envs).read(limit, select, ids, filter, version)
+            ids = [_id_to_ref(entity_id) for entity_id in ids]
+        grid = _provider().read(limit, select, ids, filter, version)
         return grid.purge()
 
     # noinspection PyUnusedLocal
@@ -429,14 +639,15 @@ class ReadHaystack(graphene.ObjectType):
             version = HSDateTime.parse_value(version)
         log.debug("resolve_histories(parent,info,ids=%s, range=%s, version=%s)",
                   ids, dates_range, version)
-        envs = cast(Dict[str, str], os.environ)
-        provider = get_singleton_provider(envs)
+        provider = _provider()
         grid_date_range = parse_date_range(dates_range, provider.get_tz())
-        return [ReadHaystack._conv_history(
-            provider.his_read(Ref(ReadHaystack._filter_id(entity_id)), grid_date_range, version),
-            info
-        )
-            for entity_id in ids]
+        # The selection is the same for all the histories
+        names = tuple(sel.name.value for sel in info.field_asts[0].selection_set.selections
+                      if sel.name.value not in ('ts', 'val'))
+        conv_history = ReadHaystack._conv_history
+        refs = [_id_to_ref(entity_id) for entity_id in ids]
+        grids = provider.his_read_many(refs, grid_date_range, version)
+        return [conv_history(grid, names) for grid in grids]
 
     # noinspection PyUnusedLocal
     @staticmethod
@@ -448,73 +659,27 @@ class ReadHaystack(graphene.ObjectType):
             version = HSDateTime.parse_value(version)
         log.debug("resolve_point_write(parent,info, entity_id=%s, version=%s)",
                   entity_id, version)
-        ref = Ref(ReadHaystack._filter_id(entity_id))
-        envs = cast(Dict[str, str], os.environ)
-        grid = get_singleton_provider(envs).point_write_read(ref, version)
+        ref = _id_to_ref(entity_id)
+        grid = _provider().point_write_read(ref, version)
         return ReadHaystack._conv_list_to_object_type(HSPointWrite, grid)
 
     @staticmethod
-    def _conv_value(entity: Entity,
-                    info: ResolveInfo) -> HSTS:
-        selection = info.field_asts[0].selection_set.selections
-        cast_value = HSTS()
-        value = entity["val"]
-        cast_value.ts = entity["ts"]  # pylint: disable=invalid-name
-        cast_value.val = value
-        for sel in selection:
-            name = sel.name.value
-            if name in ['ts', 'val']:
-                continue
-
-            if name == 'int' and isinstance(value, (int, float)):
-                cast_value.int = int(value)
-            elif name == 'float' and isinstance(value, float):
-                cast_value.float = value
-            elif name == 'str':
-                cast_value.str = str(value)
-            elif name == 'bool':
-                cast_value.bool = bool(value)
-            elif name == 'uri' and isinstance(value, Uri):
-                cast_value.uri = str(value)
-            elif name == 'ref' and isinstance(value, Ref):
-                cast_value.ref = '@' + value.name
-            elif name == 'date' and isinstance(value, date):
-                cast_value.date = value
-            elif name == 'date' and isinstance(value, datetime):
-                cast_value.date = value.date()
-            elif name == 'time' and isinstance(value, time):
-                cast_value.time = value
-            elif name == 'time' and isinstance(value, datetime):
-                cast_value.time = value.time()
-            elif name == 'datetime' and isinstance(value, datetime):
-                cast_value.datetime = value
-            elif name == 'coord' and isinstance(value, Coordinate):
-                cast_value.coord = HSCoordinate(value.latitude, value.longitude)
-        return cast_value
-
-    @staticmethod
-    def _conv_history(entities: Grid, info: ResolveInfo):
-        return [ReadHaystack._conv_value(entity, info) for entity in entities]
-
-    @staticmethod
-    def _filter_id(entity_id: str) -> str:
-        if entity_id.startswith("r:"):
-            return entity_id[2:]
-        if entity_id.startswith('@'):
-            return entity_id[1:]
-        return entity_id
+    def _conv_history(entities: Grid, names: Tuple[str, ...]):
+        # The type of values is usually the same for all the time series
+        converters: Dict[type, Callable[[datetime, Any], HSTS]] = {}
+        for entity in entities:
+            value = entity["val"]
+            value_type = type(value)
+            converter = converters.get(value_type)
+            if converter is None:
+                converter = converters[value_type] = _value_converter(names, value_type)
+            yield converter(entity["ts"], value)
 
     @staticmethod
     def _conv_entity(target_class: Type, entity: Entity):
-        entity_result = target_class()
-        for key, val in entity.items():
-            if key in entity:
-                entity_result.__setattr__(key, val)
-        return entity_result
+        return _entity_builder(target_class, tuple(entity.keys()))(entity)
 
     @staticmethod
     def _conv_list_to_object_type(target_class: Type, grid: Grid):
-        result = []
-        for row in grid:
-            result.append(ReadHaystack._conv_entity(target_class, row))
-        return result
+        conv_entity = ReadHaystack._conv_entity
+        return (conv_entity(target_class, row) for row in grid)
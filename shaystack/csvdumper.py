@@ -12,12 +12,14 @@ from __future__ import unicode_literals
 
 import datetime
 import functools
-from typing import AnyStr, List, Any, Match
+import io
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import AnyStr, List, Any, Callable, Dict, Optional, Tuple, TextIO, Iterable
 
 from .datatypes import Quantity, Coordinate, Ref, Bin, Uri, \
     MARKER, NA, REMOVE, XStr
 from .grid import Grid
-from .sortabledict import SortableDict
 from .type import Entity
 from .version import LATEST_VER, VER_3_0, Version
 from .zincdumper import dump_grid as zinc_dump_grid
@@ -25,98 +27,142 @@ from .zincdumper import dump_scalar as zinc_dump_scalar
 from .zincparser import parse_scalar as zinc_parse_scalar, ZincParseException
 
 
-def _str_csv_escape(str_value: str) -> AnyStr:
-    return str_value.replace('"', '""')
-
-
-def _uri_sub(match: Match) -> AnyStr:
-    char = match.group(0)
-    order = ord(char)
-    if order >= 0x80:
-        # Unicode
-        return '\\u%04x' % order
-    if char in '\\`':
-        return '\\%s' % char
-    return char
+# Size of the caches of the formatted values repeated in a grid (timestamps, references)
+_FORMAT_CACHE_SIZE = 4096
 
+# A ref with a display value must be quoted if one of these characters is present
+_REF_NEEDS_QUOTE = re.compile(r'[",]').search
 
-def _dump_columns(csv_result: List[str], cols: SortableDict) -> None:
-    _dump = functools.partial(_dump_column)
-    csv_result.extend(map(_dump, cols.keys()))
-    # Remove last comma
-    if csv_result:
-        csv_result[-1] = csv_result[-1][:-1]
-    csv_result.append('\n')
+# Pre-formatted small integers
+_SMALL_INT_MIN = -16
+_SMALL_INT_MAX = 256
+_SMALL_INT_STR = tuple(str(i) for i in range(_SMALL_INT_MIN, _SMALL_INT_MAX))
 
+# Number of rows dumped column by column at a time
+_ROWS_BATCH_SIZE = 1024
 
-def _dump_column(col: str) -> str:
-    return _dump_id(col) + ","
 
-
-def _dump_rows(csv_result: List[str], grid: Grid) -> None:
-    list(map(functools.partial(_dump_row, csv_result, grid), grid))
+def _str_csv_escape(str_value: str) -> AnyStr:
+    return str_value.replace('"', '""')
 
 
-def _dump_row(csv_result: List[str], grid: Grid, row: Entity) -> None:
-    row_in_csv = [dump_scalar(row.get(c), version=grid.version) + "," for c in grid.column.keys()]
-    row_in_csv[-1] = row_in_csv[-1][:-1] + '\n'
-    if len(row_in_csv) == 1 and row_in_csv[0] == '\n':
-        row_in_csv[0] = ",\n"
-    csv_result.extend(row_in_csv)
+def _dump_columns(write: Callable[[str], Any], columns: Tuple[str, ...]) -> None:
+    write(','.join(columns))
+    write('\n')
 
 
-def _dump_id(id_str: str) -> str:
-    return id_str
+def _dump_column_cells(rows: List[Entity], col: str, version: Version) -> List[str]:
+    """
+    Dump all the cells of a column.
+    Args:
+        rows: The rows to dump
+        col: The column name
+        version: The haystack version
+    Returns:
+        The CSV representation of each cell of the column
+    """
+    values = [row.get(col) for row in rows]
+    value_types = set(map(type, values))
+    with_none = type(None) in value_types
+    value_types.discard(type(None))
+    if len(value_types) == 1:
+        dump = _TYPE_DISPATCH.get(value_types.pop())
+        if dump is not None:
+            if not with_none:
+                return list(map(dump, values))
+            return [dump(value) if value is not None else '' for value in values]
+    return [dump_scalar(value, version) for value in values]
+
+
+def _dump_rows(write: Callable[[str], Any], grid: Grid, columns: Tuple[str, ...], version: Version) -> None:
+    # Dump column by column, with a single dump function for a column with one type of values,
+    # and a batch of rows at a time to keep the memory bounded
+    all_rows = grid._row  # pylint: disable=protected-access
+    for first in range(0, len(all_rows), _ROWS_BATCH_SIZE):
+        rows = all_rows[first:first + _ROWS_BATCH_SIZE]
+        if not columns:
+            write(',\n' * len(rows))  # A row with only one empty cell
+            continue
+        cells_by_column = [_dump_column_cells(rows, col, version) for col in columns]
+        # A row with only one empty cell is dumped as a comma
+        write('\n'.join([line if line else ',' for line in map(','.join, zip(*cells_by_column))]))
+        write('\n')
+
+
+# A zinc scalar starts with one of these characters, or is a XStr with a parenthesis
+_ZINC_SCALAR_FIRST_CHARS = frozenset('0123456789_.+-"`@[{<^ABCDEFGHIJKLMNOPQRSTUVWXYZ')
 
 
 def _dump_str(str_value: str) -> str:
+    if str_value and str_value[0] not in _ZINC_SCALAR_FIRST_CHARS and '(' not in str_value:
+        # Can not be parsed as a zinc scalar, skip the parser
+        return f'"{_str_csv_escape(str_value)}"'
     try:
         zinc_parse_scalar(str_value)  # Is it ambiguous ?
         # Yes
-        return '"""' + _str_csv_escape(str_value) + '"""'
+        return f'"""{_str_csv_escape(str_value)}"""'
     except ZincParseException:
         # No
-        return '"' + _str_csv_escape(str_value) + '"'
+        return f'"{_str_csv_escape(str_value)}"'
 
 
 def _dump_uri(uri_value: Uri) -> str:
-    return '"`%s`"' % _str_csv_escape(str(uri_value))
+    return f'"`{_str_csv_escape(str(uri_value))}`"'
 
 
 def _dump_bin(bin_value: Bin) -> str:
-    return 'Bin(%s)' % bin_value
+    return f'Bin({bin_value})'
 
 
 def _dump_xstr(xstr_value: XStr) -> str:
-    return '"' + _str_csv_escape('%s("%s")' % (xstr_value.encoding, xstr_value.data_to_string())) + '"'
+    str_xstr = f'{xstr_value.encoding}("{xstr_value.data_to_string()}")'
+    return f'"{_str_csv_escape(str_xstr)}"'
 
 
 def _dump_quantity(quantity: Quantity) -> str:
     if (quantity.symbol is None) or (quantity.symbol == ''):
         return _dump_decimal(quantity.m)
-    return '%s%s' % (_dump_decimal(quantity.m),
-                     quantity.symbol)
+    return f'{_dump_decimal(quantity.m)}{quantity.symbol}'
 
 
 def _dump_decimal(decimal: float) -> str:
     return str(decimal)
 
 
+def _dump_int(int_value: int) -> str:
+    if _SMALL_INT_MIN <= int_value < _SMALL_INT_MAX:
+        return _SMALL_INT_STR[int_value - _SMALL_INT_MIN]
+    return str(int_value)
+
+
+def _dump_float(float_value: float) -> str:
+    return str(float_value)
+
+
+_BOOL_STR = {True: 'true', False: 'false'}
+
+
 def _dump_bool(bool_value: bool) -> str:
-    return 'true' if bool(bool_value) else 'false'
+    return _BOOL_STR[bool_value]
 
 
 def _dump_coord(coordinate: Coordinate) -> str:
-    return '"' + zinc_dump_scalar(coordinate) + '"'
+    return f'"{zinc_dump_scalar(coordinate)}"'
 
 
 def _dump_ref(ref: Ref) -> str:
     if ref.has_value:
-        str_ref = '@%s %s' % (ref.name, ref.value)
-        if '"' in str_ref or ',' in str_ref:
-            str_ref = '"' + str_ref + '"'
-        return str_ref
-    return '@%s' % ref.name
+        # Ref.__eq__ ignore the value, so the cache use the name and the value
+        return _dump_ref_with_value(ref.name, ref.value)
+    return f'@{ref.name}'
+
+
+@functools.lru_cache(maxsize=_FORMAT_CACHE_SIZE)
+def _dump_ref_with_value(name: str, value: str) -> str:
+    str_ref = f'@{name} {value}'
+    if _REF_NEEDS_QUOTE(str_ref) is not None:
+        str_ref = f'"{str_ref}"'
+    return str_ref
 
 
 def _dump_date(a_date: datetime.date) -> str:
@@ -130,7 +176,49 @@ def _dump_time(time: datetime.time) -> str:
 def _dump_date_time(date_time: datetime.datetime) -> str:
     # tz_name = timezone_name(date_time)
     # return '%s %s' % (date_time.isoformat(), tz_name)
-    return '%s' % (date_time.isoformat())  # Note: Excel can not parse the date time with tz_name
+    # Note: Excel can not parse the date time with tz_name
+    # Aware datetimes are equal for the same instant, so the key add the tzinfo and the fold
+    return _date_time_isoformat(date_time, date_time.tzinfo, date_time.fold)
+
+
+@functools.lru_cache(maxsize=_FORMAT_CACHE_SIZE)
+def _date_time_isoformat(date_time: datetime.datetime,
+                         tzinfo: Optional[datetime.tzinfo],  # pylint: disable=unused-argument
+                         fold: int) -> str:  # pylint: disable=unused-argument
+    return date_time.isoformat()
+
+
+def _dump_none(_: None) -> str:
+    return ''
+
+
+def _dump_marker(_: Any) -> str:
+    return '\u2713'
+
+
+def _dump_remove(_: Any) -> str:
+    return 'R'
+
+
+# Dump function for the exact type of a scalar, without the `isinstance` cascade
+_TYPE_DISPATCH: Dict[type, Callable[[Any], str]] = {
+    type(None): _dump_none,
+    type(MARKER): _dump_marker,
+    type(REMOVE): _dump_remove,
+    bool: _dump_bool,
+    Ref: _dump_ref,
+    Bin: _dump_bin,
+    XStr: _dump_xstr,
+    Uri: _dump_uri,
+    str: _dump_str,
+    datetime.datetime: _dump_date_time,
+    datetime.time: _dump_time,
+    datetime.date: _dump_date,
+    Coordinate: _dump_coord,
+    Quantity: _dump_quantity,
+    float: _dump_float,
+    int: _dump_int,
+}
 
 
 def dump_scalar(scalar: Any, version: Version = LATEST_VER) -> str:
@@ -140,49 +228,71 @@ def dump_scalar(scalar: Any, version: Version = LATEST_VER) -> str:
         scalar: The scalar value
         version: The haystack version
     """
-    if scalar is None:
-        return ''
-    if scalar is NA:
-        if version < VER_3_0:
+    dump = _TYPE_DISPATCH.get(type(scalar))
+    if dump is not None:
+        return dump(scalar)
+    return _dump_scalar_by_instance(scalar, version)
+
+
+# CSV representation of the singletons, with the minimum haystack version
+_SINGLETONS: Dict[int, Tuple[str, Optional[Version]]] = {
+    id(None): ('', None),
+    id(MARKER): ('\u2713', None),
+    id(REMOVE): ('R', None),
+    id(NA): ('NA', VER_3_0),
+}
+
+
+def _dump_scalar_by_instance(scalar: Any, version: Version) -> str:
+    singleton = _SINGLETONS.get(id(scalar))
+    if singleton is not None:
+        str_value, min_version = singleton
+        if min_version is not None and version < min_version:
             raise ValueError('Project Haystack version %s '
-                             'does not support NA'
-                             % version)
-        return 'NA'
-    if scalar is MARKER:
-        return '\u2713'
-    if scalar is REMOVE:
-        return 'R'
-    if isinstance(scalar, bool):
-        return _dump_bool(scalar)
-    if isinstance(scalar, Ref):
-        return _dump_ref(scalar)
-    if isinstance(scalar, Bin):
-        return _dump_bin(scalar)
-    if isinstance(scalar, XStr):
-        return _dump_xstr(scalar)
-    if isinstance(scalar, Uri):
-        return _dump_uri(scalar)
-    if isinstance(scalar, str):
-        return _dump_str(scalar)
-    if isinstance(scalar, datetime.datetime):
-        return _dump_date_time(scalar)
-    if isinstance(scalar, datetime.time):
-        return _dump_time(scalar)
-    if isinstance(scalar, datetime.date):
-        return _dump_date(scalar)
-    if isinstance(scalar, Coordinate):
-        return _dump_coord(scalar)
-    if isinstance(scalar, Quantity):
-        return _dump_quantity(scalar)
-    if isinstance(scalar, (float, int)):
-        return _dump_decimal(scalar)
-    if isinstance(scalar, list):
-        return '"' + _str_csv_escape(zinc_dump_scalar(scalar, version=version)) + '"'
-    if isinstance(scalar, dict):
-        return '"' + _str_csv_escape(zinc_dump_scalar(scalar, version=version)) + '"'
-    if isinstance(scalar, Grid):
-        return '"' + _str_csv_escape("<<" + zinc_dump_grid(scalar) + ">>") + '"'
-    return '"' + _str_csv_escape(zinc_dump_scalar(scalar)) + '"'
+                             'does not support %s'
+                             % (version, str_value))
+        return str_value
+    return _dump_scalar_by_class(scalar, version)
+
+
+@functools.singledispatch
+def _dump_scalar_by_class(scalar: Any, _: Version) -> str:
+    """ Dump a scalar with a subclass of the haystack types, or an unknown type """
+    return f'"{_str_csv_escape(zinc_dump_scalar(scalar))}"'
+
+
+@_dump_scalar_by_class.register(list)
+@_dump_scalar_by_class.register(dict)
+def _dump_collection(scalar: Any, version: Version) -> str:
+    return f'"{_str_csv_escape(zinc_dump_scalar(scalar, version=version))}"'
+
+
+@_dump_scalar_by_class.register(Grid)
+def _dump_inner_grid(scalar: Grid, _: Version) -> str:
+    return f'"{_str_csv_escape(f"<<{zinc_dump_grid(scalar)}>>")}"'
+
+
+def _register_by_class() -> None:
+    """ Register the functions of `_TYPE_DISPATCH` for the subclasses """
+    for a_type, dump in _TYPE_DISPATCH.items():
+        if a_type not in (type(None), type(MARKER), type(REMOVE)):
+            _dump_scalar_by_class.register(a_type, lambda scalar, _, dump=dump: dump(scalar))
+
+
+_register_by_class()
+
+
+def dump_grid_to(stream: TextIO, grid: Grid) -> None:
+    """Write a single grid in its CSV representation, row by row.
+
+    Args:
+        stream: The text stream to write to
+        grid: The grid to dump
+    """
+    write = stream.write
+    columns = tuple(grid.column.keys())
+    _dump_columns(write, columns)
+    _dump_rows(write, grid, columns, grid.version)
 
 
 def dump_grid(grid: Grid) -> AnyStr:
@@ -193,9 +303,22 @@ def dump_grid(grid: Grid) -> AnyStr:
     Returns:
         a string with a CSV representation
     """
+    buffer = io.StringIO()
+    dump_grid_to(buffer, grid)
+    return buffer.getvalue()
+
+
+def dump_grids(grids: Iterable[Grid], max_workers: Optional[int] = None) -> List[str]:
+    """Dump independent grids to their CSV representations, in parallel processes.
 
-    # Use list and join
-    csv_result: List[str] = []
-    _dump_columns(csv_result, grid.column)
-    _dump_rows(csv_result, grid)
-    return ''.join(csv_result)
+    Args:
+        grids: The grids to dump
+        max_workers: The maximum number of processes (default: the number of CPU)
+    Returns:
+        a list of strings with the CSV representations, in the order of the grids
+    """
+    grids = list(grids)
+    if len(grids) <= 1 or max_workers == 1:
+        return [dump_grid(grid) for grid in grids]
+    with ProcessPoolExecutor(max_workers) as executor:
+        return list(executor.map(dump_grid, grids))
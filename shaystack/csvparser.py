@@ -8,6 +8,7 @@
 Parse CSV file conform with the specification describe here (https://www.project-haystack.org/doc/Csv)
 and produce a `Grid` instance.
 """
+import sys
 from csv import reader
 from io import StringIO
 from typing import Any
@@ -34,7 +35,7 @@ def parse_grid(grid_str: str) -> Grid:
     # for row in csv.reader(grid_str.splitlines()): print(row)
     csv_reader = reader(StringIO(grid_str))
     i = iter(csv_reader)
-    headers = next(i)
+    headers = [sys.intern(header) for header in next(i)]
     grid = Grid(version=version, columns=((x, {}) for x in headers))
     for row in i:
         a_map = {}
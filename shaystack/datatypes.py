@@ -14,6 +14,7 @@ See https://www.project-haystack.org/doc/TagModel#tagKinds
 import base64
 import binascii
 import re
+import sys
 from typing import Optional, NewType
 
 from .pintutil import unit_reg, _to_pint_unit
@@ -47,6 +48,10 @@ class Quantity(unit_reg.Quantity):
         new_quantity.symbol = units
         return new_quantity
 
+    def __reduce__(self):
+        # Pickle with the original symbol, to keep this class
+        return Quantity, (self.m, self.symbol)
+
 
 class Coordinate:
     """A 2D co-ordinate in degrees latitude and longitude.
@@ -166,6 +171,10 @@ class _Singleton:
         # A singleton return himself
         return self
 
+    def __reduce__(self) -> str:
+        # Unpickle to the singleton, with the name of the global variable
+        return repr(self)
+
     def __hash__(self) -> int:
         return hash(self.__class__)
 
@@ -207,14 +216,19 @@ class Ref:
             value: the comment to describe the reference
     """
 
-    __slots__ = "name", "value"
+    __slots__ = "name", "value", "_hash"
 
     def __init__(self, name: str, value: Optional[str] = None):
         if name.startswith("@"):
             name = name[1:]
         assert isinstance(name, str) and re.match("^[a-zA-Z0-9_:\\-.~]+$", name)
-        self.name = name
+        self.name = sys.intern(name)
         self.value = value
+        self._hash = hash(self.name)  # Refs are the keys of the grid index
+
+    def __reduce__(self):
+        # The hash of a str is not the same in another process
+        return Ref, (self.name, self.value)
 
     @property
     def has_value(self):
@@ -235,7 +249,7 @@ class Ref:
     def __eq__(self, other: 'Ref') -> bool:
         if not isinstance(other, Ref):
             return False
-        return self.name == other.name
+        return self.name is other.name or self.name == other.name
 
     def __ne__(self, other: 'Ref'):
         if not isinstance(other, Ref):
@@ -255,4 +269,4 @@ class Ref:
         return self.name.__ge__(other.name)
 
     def __hash__(self) -> int:
-        return hash(self.name)
+        return self._hash
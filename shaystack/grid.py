@@ -13,15 +13,18 @@ It's like a list of dict.
 
 import copy
 import datetime
+import itertools
 import logging
 import numbers
+import operator
 import re
+import sys
 from collections import MutableSequence, Sequence  # pylint: disable=no-name-in-module
-from typing import Union, Iterable, Any, Optional, KeysView, Tuple, List, cast, Dict
+from typing import Union, Iterable, Iterator, Any, Optional, KeysView, Tuple, List, cast, Dict, Callable
 
 import pytz
 
-from .datatypes import NA, Quantity, Coordinate, Ref
+from .datatypes import NA, MARKER, REMOVE, Quantity, Coordinate, Ref, Uri, Bin
 from .metadata import MetadataObject
 from .sortabledict import SortableDict
 from .type import Entity
@@ -29,9 +32,45 @@ from .version import Version, VER_3_0
 
 log = logging.getLogger("ping.Provider")
 
+# The values shared, and not duplicated, by `Grid.copy()`
+_IMMUTABLE_TYPES = frozenset([type(None), bool, int, float, str, Uri, Bin, Ref,
+                              datetime.date, datetime.time, datetime.datetime,
+                              type(MARKER), type(NA), type(REMOVE)])
+
+
+_REPR_MAX_ROWS = 20  # Only the first and last rows are printed by repr()
+_ABSENT = object()
+_ABSENTS = itertools.repeat(_ABSENT)
+
+
+def _row_fingerprint(row: Entity) -> Tuple:
+    """
+    Calculate a fingerprint of a row, identical for approximately equal rows (see `_approx_check()`).
+    The numbers are compared with a tolerance, so only the tags, the strings and the references are
+    used with the values. The other values are represented by their types.
+    Args:
+        row: The entity
+    Returns:
+        A hashable fingerprint
+    """
+    fingerprint = []
+    for key, val in row.items():
+        if val is None:  # Same as a missing tag
+            continue
+        if isinstance(val, numbers.Number):
+            fingerprint.append((key, numbers.Number))
+        elif isinstance(val, str):
+            fingerprint.append((key, str(val)))  # Some sub-classes are not hashable
+        elif isinstance(val, Ref):
+            fingerprint.append((key, val))
+        else:
+            fingerprint.append((key, type(val)))
+    fingerprint.sort(key=lambda item: item[0])
+    return tuple(fingerprint)
+
 
 # noinspection PyArgumentList
-class Grid(MutableSequence):  # pytlint: disable=too-many-ancestors
+class Grid(MutableSequence):  # pylint: disable=too-many-ancestors,too-many-instance-attributes
     """A grid is basically a series of tabular records. The grid has a header
     which describes some metadata about the grid and its columns. This is
     followed by zero or more rows.
@@ -56,7 +95,8 @@ class Grid(MutableSequence):  # pytlint: disable=too-many-ancestors
         columns: A list of columns, or a dictionary with columns name and corresponding metadata
     """
 
-    __slots__ = "_version", "_version_given", "metadata", "column", "_row", "_index"
+    __slots__ = "_version", "_version_given", "metadata", "column", "_row", "_index", "_position", \
+                "_validate_values"
 
     def __init__(self,
                  version: Union[str, Version, None] = None,
@@ -72,6 +112,8 @@ class Grid(MutableSequence):  # pytlint: disable=too-many-ancestors
             version = VER_3_0
         self._version = version
         self._version_given = version_given
+        # Only the grids before the version 3.0 must detect or validate the values
+        self._validate_values = self.nearest_version < VER_3_0
 
         # Metadata
         self.metadata = MetadataObject(validate_fn=self._detect_or_validate)
@@ -83,7 +125,10 @@ class Grid(MutableSequence):  # pytlint: disable=too-many-ancestors
         self._row: List[Entity] = []
 
         # Internal index
-        self._index: Optional[Dict[Ref, Entity]] = None
+        self._index: Optional[Dict[Ref, Entity]] = None  # Ref keys cache their hash
+
+        # Position of entities, by identity (see `_position_of()`)
+        self._position: Dict[int, int] = {}
 
         if metadata is not None:
             self.metadata.update(metadata.items())
@@ -95,56 +140,17 @@ class Grid(MutableSequence):  # pytlint: disable=too-many-ancestors
                 if columns and not isinstance(columns[0], tuple):
                     columns = list(zip(columns, [{}] * len(columns)))
 
+            new_columns = []
             for col_id, col_meta in columns:
                 # Convert sorted lists and dicts back to a list of items.
                 if isinstance(col_meta, (dict, SortableDict)):
                     col_meta = list(col_meta.items())
 
                 metadata_object = MetadataObject(validate_fn=self._detect_or_validate)
-                metadata_object.extend(col_meta)
-                self.column.add_item(col_id, metadata_object)
-
-    # noinspection PyArgumentList
-    @staticmethod
-    def _approx_check(version_1: Any, version_2: Any) -> bool:
-        """
-        Compare two values with a tolerance
-
-        Args:
-            version_1: value one
-            version_2: value two
-        Returns:
-            true if the values are approximately identical
-        """
-        if isinstance(version_1, numbers.Number) and isinstance(version_2, numbers.Number):
-            # noinspection PyUnresolvedReferences
-            return abs(version_1 - version_2) < 0.000001
-        # pylint: disable=C0123
-        if type(version_1) != type(version_2) and \
-                not (isinstance(version_1, str) and isinstance(version_2, str)):
-            return False
-        # pylint: enable=C0123
-        if isinstance(version_1, datetime.time) and isinstance(version_2, datetime.time):
-            # noinspection PyArgumentList
-            return version_1.replace(microsecond=0) == version_2.replace(microsecond=0)
-        if isinstance(version_1, datetime.datetime) and isinstance(version_2, datetime.datetime):
-            dt1, dt2 = version_1.replace(tzinfo=pytz.UTC), version_2.replace(tzinfo=pytz.UTC)
-            return dt1.date() == dt2.date() and Grid._approx_check(dt1.time(), dt2.time())
-        if isinstance(version_1, Quantity) and isinstance(version_2, Quantity):
-            return version_1.units == version_2.units and \
-                   Grid._approx_check(version_1.m, version_2.m)
-        if isinstance(version_1, Coordinate) and isinstance(version_2, Coordinate):
-            return Grid._approx_check(version_1.latitude, version_2.latitude) and \
-                   Grid._approx_check(version_1.longitude, version_2.longitude)
-        if isinstance(version_1, dict) and isinstance(version_2, dict):
-            for key, val in version_1.items():
-                if not Grid._approx_check(val, version_2.get(key, None)):
-                    return False
-            for key, val in version_2.items():
-                if key not in version_1 and not Grid._approx_check(version_1.get(key, None), val):
-                    return False
-            return True
-        return version_1 == version_2
+                metadata_object.bulk_load(col_meta)
+                # Interned, the tag lookups in the entities are faster
+                new_columns.append((sys.intern(col_id), metadata_object))
+            self.column.bulk_load(new_columns)
 
     def __eq__(self, other: 'Grid') -> bool:
         """
@@ -156,44 +162,57 @@ class Grid(MutableSequence):  # pytlint: disable=too-many-ancestors
         """
         if not isinstance(other, Grid):
             return False
-        if set(self.metadata.keys()) != set(other.metadata.keys()):
+        if self is other:
+            return True
+        if len(self) != len(other):
             return False
-        for key in self.metadata.keys():
-            if not Grid._approx_check(self.metadata[key], other.metadata[key]):
+        # The metadata and the columns may be shared (see filter() or slice)
+        if self.metadata is not other.metadata:
+            if set(self.metadata.keys()) != set(other.metadata.keys()):
                 return False
+            for key in self.metadata.keys():
+                if not _approx_check(self.metadata[key], other.metadata[key]):
+                    return False
         # Check column matches
-        if set(self.column.keys()) != set(other.column.keys()):
-            return False
-
-        for col_name in self.column.keys():
-            if col_name not in other.column or \
-                    len(self.column[col_name]) != len(other.column[col_name]):
+        if self.column is not other.column:
+            if set(self.column.keys()) != set(other.column.keys()):
                 return False
-            for key in self.column[col_name].keys():
-                if not Grid._approx_check(self.column[col_name][key], other.column[col_name][key]):
+
+            for col_name in self.column.keys():
+                if col_name not in other.column or \
+                        len(self.column[col_name]) != len(other.column[col_name]):
                     return False
+                for key in self.column[col_name].keys():
+                    if not _approx_check(self.column[col_name][key], other.column[col_name][key]):
+                        return False
         # Check row matches
-        if len(self) != len(other):
-            return False
 
-        pending_right_row = [id(row) for row in other if 'id' not in row]
+        other._ensure_index()  # pylint: disable=protected-access
+        other_index = other._index
+        # The rows without id, by fingerprint, and in the original order
+        pending_right_row: Dict[int, Entity] = {}
+        right_by_fingerprint: Dict[Tuple, List[Entity]] = {}
+        for right in other._row:
+            if 'id' not in right:
+                pending_right_row[id(right)] = right
+                right_by_fingerprint.setdefault(_row_fingerprint(right), []).append(right)
         for left in self._row:
             # Search record in other with same values
-            find = False
             if 'id' in left:
-                if left['id'] in other:
-                    if self._approx_check(left, other[left['id']]):
-                        find = True
-            else:
-                for right in other._row:
-                    if id(right) not in pending_right_row:
-                        continue
-                    if self._approx_check(left, right):
-                        find = True
-                        pending_right_row.remove(id(right))
-                        break
-            if not find:
+                right = other_index.get(left['id'])
+                if right is None or not _approx_check(left, right):
+                    return False
+                continue
+            candidates = right_by_fingerprint.get(_row_fingerprint(left), [])
+            match = next((right for right in candidates
+                          if id(right) in pending_right_row and _approx_check(left, right)), None)
+            if match is None:
+                # The fingerprint is only a hint, try all the others rows
+                match = next((right for right in pending_right_row.values()
+                              if _approx_check(left, right)), None)
+            if match is None:
                 return False
+            del pending_right_row[id(match)]
 
         return True
 
@@ -259,13 +278,23 @@ class Grid(MutableSequence):  # pytlint: disable=too-many-ancestors
             parts.append('\tNo columns')
 
         if bool(self):
-            parts.extend([
-                '\t---- Row %4d:\n\t%s' % (row, '\n\t'.join([
-                    (('%s=%r' % (col_name, data[col_name]))
-                     if col_name in data else
-                     ('%s absent' % col_name)) for col_name in self.column.keys()]))
-                for (row, data) in enumerate(self)
-            ])
+            rows = self._row
+            col_names = tuple(self.column.keys())
+
+            def _repr_rows(start: int, end: int) -> None:
+                for row in range(start, end):
+                    data = rows[row]
+                    parts.append('\t---- Row %4d:\n\t%s' % (row, '\n\t'.join([
+                        ('%s absent' % col_name) if val is _ABSENT else ('%s=%r' % (col_name, val))
+                        for col_name, val in zip(col_names, map(data.get, col_names, _ABSENTS))])))
+
+            if len(rows) > _REPR_MAX_ROWS:
+                half = _REPR_MAX_ROWS // 2
+                _repr_rows(0, half)
+                parts.append('\t... %d rows omitted ...' % (len(rows) - _REPR_MAX_ROWS))
+                _repr_rows(len(rows) - half, len(rows))
+            else:
+                _repr_rows(0, len(rows))
         else:
             parts.append('\tNo rows')
         class_name = self.__class__.__name__
@@ -286,15 +315,19 @@ class Grid(MutableSequence):  # pytlint: disable=too-many-ancestors
         if isinstance(key, int):
             return cast(Entity, self._row[key])
         if isinstance(key, slice):
-            result = Grid(version=self.version, metadata=self.metadata, columns=self.column)
-            result._row = self._row[key]
-            result._index = None
-            return result
+            return self._shallow_from(self._row[key])
         assert isinstance(key, Ref), "The 'key' must be a Ref or int"
-        if not self._index:
-            self.reindex()
+        self._ensure_index()
         return cast(Entity, self._index[key])
 
+    def __iter__(self) -> Iterator[Entity]:
+        """Iterate over the entities, without a `__getitem__` call per row.
+
+        Returns:
+            An iterator on the entities
+        """
+        return iter(self._row)
+
     def __contains__(self, key: Union[int, Ref]) -> bool:
         """Return an entity with the corresponding id.
 
@@ -306,8 +339,7 @@ class Grid(MutableSequence):  # pytlint: disable=too-many-ancestors
         """
         if isinstance(key, int):
             return 0 <= key < len(self._row)
-        if not self._index:
-            self.reindex()
+        self._ensure_index()
         return key in self._index
 
     def __len__(self) -> int:
@@ -323,34 +355,36 @@ class Grid(MutableSequence):  # pytlint: disable=too-many-ancestors
         Returns:
             `self`
         """
-        if isinstance(value, dict):
+        if isinstance(value, dict) and self._validate_values:
             for val in value.values():
                 self._detect_or_validate(val)
         if isinstance(index, int):
             if not isinstance(value, dict):
                 raise TypeError('value must be a dict')
-            if "id" in self._row[index]:
-                self._index.pop(self._row[index]['id'], None)
+            if self._index is not None:
+                if "id" in self._row[index]:
+                    self._index.pop(self._row[index]['id'], None)
+                if "id" in value:
+                    self._index[value["id"]] = value
             self._row[index] = value
-            if "id" in value:
-                self._index[value["id"]] = value
         elif isinstance(index, slice):
             if isinstance(value, dict):
                 raise TypeError('value must be iterable, not a dict')
             self._index = None
             self._row[index] = value
-            for row in value:
-                for val in row.values():
-                    self._detect_or_validate(val)
+            if self._validate_values:
+                for row in value:
+                    for val in row.values():
+                        self._detect_or_validate(val)
         else:
             if not isinstance(value, dict):
                 raise TypeError('value must be a dict')
-            if not self._index:
-                self.reindex()
-            idx = list.index(self._row, self._index[index])
+            self._ensure_index()
+            idx = self._position_of(self._index[index])
             if "id" in self._row[idx]:
                 self._index.pop(self._row[idx]['id'], None)
             self._row[idx] = value
+            self._position[id(value)] = idx
             if "id" in value:
                 self._index[value["id"]] = value
         return self
@@ -389,8 +423,7 @@ class Grid(MutableSequence):  # pytlint: disable=too-many-ancestors
         Returns:
             The entity with the id == index or the default value
         """
-        if not self._index:
-            self.reindex()
+        self._ensure_index()
         return cast(Entity, self._index.get(index, default))
 
     def keys(self) -> KeysView[Ref]:
@@ -399,8 +432,7 @@ class Grid(MutableSequence):  # pytlint: disable=too-many-ancestors
         Returns:
              The list of ids of entities with `id`
         """
-        if not self._index:
-            self.reindex()
+        self._ensure_index()
         return self._index.keys()
 
     def pop(self, *index: Union[int, Ref]) -> Optional[Entity]:
@@ -412,23 +444,30 @@ class Grid(MutableSequence):  # pytlint: disable=too-many-ancestors
             *index: A list of index (position or reference)
         """
         ret_value = None
-        for key in sorted(index, reverse=True):  # Remove index at the end
+        removed_pos = set()
+        removed_ids = set()  # Identity of the entities found by reference
+        for key in sorted(index, reverse=True):  # The last one is the first deleted item
             if isinstance(key, int):
                 if not 0 <= key < len(self._row):
                     ret_value = None
                 else:
-                    if "id" in self._row[key] and self._index:
-                        del self._index[self._row[key]['id']]
+                    removed_pos.add(key)
                     ret_value = self._row[key]
-                    del self._row[key]
             else:
-                if not self._index:
-                    self.reindex()
-                if key not in self._index:
-                    ret_value = None
+                self._ensure_index()
+                ret_value = self._index.get(key)
+                if ret_value is not None:
+                    removed_ids.add(id(ret_value))
+        if removed_pos or removed_ids:
+            # Rebuild the rows in a single pass
+            kept_rows = []
+            for pos, row in enumerate(self._row):
+                if pos in removed_pos or id(row) in removed_ids:
+                    if self._index and "id" in row:
+                        self._index.pop(row["id"], None)
                 else:
-                    self._row.remove(self._index[key])
-                    ret_value = self._index.pop(key)
+                    kept_rows.append(row)
+            self._row = kept_rows
         return cast(Optional[Entity], ret_value)
 
     def insert(self, index: int, value: Entity) -> 'Grid':
@@ -442,25 +481,28 @@ class Grid(MutableSequence):  # pytlint: disable=too-many-ancestors
         """
         if not isinstance(value, dict):
             raise TypeError('value must be a dict')
-        for val in value.values():
-            self._detect_or_validate(val)
+        if self._validate_values:
+            for val in value.values():
+                self._detect_or_validate(val)
         self._row.insert(index, value)
         if "id" in value:
-            if not self._index:
-                self.reindex()
+            self._ensure_index()
             self._index[value["id"]] = value
         return self
 
+    def _ensure_index(self) -> None:
+        """Build the index of entities by id, if it is not present."""
+        if self._index is None:
+            self.reindex()
+
     def reindex(self) -> 'Grid':
         """Reindex the grid if the user, update directly an id of a row.
         Returns
             `self`
         """
-        self._index = {}
-        for item in self._row:
-            if "id" in item:
-                assert isinstance(item["id"], Ref), "The 'id' tag must be a reference"
-                self._index[item["id"]] = item
+        self._index = {item["id"]: item for item in self._row if "id" in item}
+        if __debug__:
+            assert all(isinstance(ref, Ref) for ref in self._index), "The 'id' tag must be a reference"
         return self
 
     def pack_columns(self) -> 'Grid':
@@ -469,15 +511,17 @@ class Grid(MutableSequence):  # pytlint: disable=too-many-ancestors
         Returns:
             `self`
         """
-        using_columns = set()
-        columns_keys = self.column.keys()
-        for row in self._row:
-            for col_name in columns_keys:
-                if col_name in row:
-                    using_columns.add(col_name)
-                if len(using_columns) == len(columns_keys):  # All columns was found
-                    return self
-        self.column = {k: self.column[k] for k in using_columns}
+        rows = self._row
+        # Stop the scan of a column at the first row with this tag, and keep the order of columns
+        unused_columns = [col_name for col_name in self.column.keys()
+                          if not any(col_name in row for row in rows)]
+        if unused_columns:
+            # The columns may be shared with another grid, so they are replaced
+            unused = set(unused_columns)
+            new_cols = SortableDict()
+            new_cols.bulk_load((col_name, col_meta) for col_name, col_meta in self.column.items()
+                               if col_name not in unused)
+            self.column = new_cols
         return self
 
     def extends_columns(self) -> 'Grid':
@@ -487,12 +531,14 @@ class Grid(MutableSequence):  # pytlint: disable=too-many-ancestors
         Returns:
             `self`
         """
-        new_cols = self.column.copy()
-        for row in self._row:
-            for k in row.keys():
-                if k not in new_cols:
-                    new_cols[k] = {}
-        self.column = new_cols
+        columns = self.column
+        new_keys = dict.fromkeys(k for row in self._row for k in row.keys() if k not in columns)
+        if new_keys:
+            # The columns may be shared with another grid (see filter()), so they are replaced
+            new_cols = SortableDict()
+            new_cols.bulk_load(columns.items())
+            new_cols.bulk_load((k, {}) for k in new_keys)
+            self.column = new_cols
         return self
 
     def extend(self, values: Iterable[Entity]) -> 'Grid':
@@ -504,10 +550,16 @@ class Grid(MutableSequence):  # pytlint: disable=too-many-ancestors
         Returns:
             `self`
         """
-        super().extend(values)
-        for item in self._row:
-            if "id" in item:
-                self._index[item["id"]] = item
+        values = list(values)
+        for value in values:
+            if not isinstance(value, dict):
+                raise TypeError('value must be a dict')
+            if self._validate_values:
+                for val in value.values():
+                    self._detect_or_validate(val)
+        self._row.extend(values)
+        if self._index is not None:
+            self._index.update((value["id"], value) for value in values if "id" in value)
         return self
 
     def sort(self, tag: str) -> 'Grid':
@@ -518,7 +570,16 @@ class Grid(MutableSequence):  # pytlint: disable=too-many-ancestors
         Returns:
             `self`
         """
-        self._row = sorted(self._row, key=lambda row: row[tag])
+        rows = self._row
+        keys = list(map(operator.itemgetter(tag), rows))
+        if keys and isinstance(keys[0], Quantity):
+            units = keys[0].units
+            if all(isinstance(key, Quantity) and key.units == units for key in keys):
+                # Compare the magnitudes, without the unit conversions of pint
+                keys = [key.m for key in keys]
+        order = sorted(range(len(rows)), key=keys.__getitem__)
+        self._row = [rows[i] for i in order]
+        self._position = {}
         return self
 
     def copy(self) -> 'Grid':
@@ -529,8 +590,20 @@ class Grid(MutableSequence):  # pytlint: disable=too-many-ancestors
         Returns:
             A copy of the current grid.
         """
-        a_copy = copy.deepcopy(self)
-        a_copy._index = None  # Remove index pylint: disable=protected-access
+        # pylint: disable=protected-access
+        a_copy = object.__new__(self.__class__)
+        memo = {id(self): a_copy}  # The validate_fn of metadata are bound to the new grid
+        a_copy._version = self._version
+        a_copy._version_given = self._version_given
+        a_copy._validate_values = self._validate_values
+        a_copy.metadata = copy.deepcopy(self.metadata, memo)
+        a_copy.column = copy.deepcopy(self.column, memo)
+        a_copy._row = [{key: val if type(val) in _IMMUTABLE_TYPES else copy.deepcopy(val, memo)
+                        for key, val in row.items()}
+                       for row in self._row]
+        a_copy._index = None  # Remove index
+        a_copy._position = {}
+        # pylint: enable=protected-access
         return a_copy
 
     def filter(self, grid_filter: str, limit: int = 0) -> 'Grid':
@@ -552,18 +625,19 @@ class Grid(MutableSequence):  # pytlint: disable=too-many-ancestors
         if grid_filter is None or grid_filter.strip() == '':
             if limit == 0:
                 return self
-            result = Grid(version=self.version, metadata=self.metadata, columns=self.column)
-            result.extend(self.__getitem__(slice(0, limit)))
-            return result
-
-        result = Grid(version=self.version, metadata=self.metadata, columns=self.column)
-        a_filter = filter_function(grid_filter)
-        for row in self._row:
-            if a_filter(self, row):
-                result.append(row)
-            if limit and len(result) == limit:
-                break
-        return result
+            return self._shallow_from(self._row[:limit])
+
+        a_filter = filter_function(grid_filter)  # Compiled once, and cached by filter string
+        if limit:
+            rows = []
+            for row in self._row:
+                if a_filter(self, row):
+                    rows.append(row)
+                    if len(rows) == limit:
+                        break
+        else:
+            rows = [row for row in self._row if a_filter(self, row)]
+        return self._shallow_from(rows)
 
     def select(self, select: Optional[str]) -> 'Grid':
         """
@@ -614,12 +688,50 @@ class Grid(MutableSequence):  # pytlint: disable=too-many-ancestors
             new_grid.append({key: val for key, val in row.items() if key in cols})
         return new_grid
 
+    def _shallow_from(self, rows: List[Entity]) -> 'Grid':
+        """Create a grid with other rows, and a copy of the metadata and the columns of this grid.
+        Args:
+            rows: The rows of the new grid (already validated by this grid)
+        Returns:
+            The new grid
+        """
+        # pylint: disable=protected-access
+        result = object.__new__(Grid)
+        result._version = self._version
+        result._version_given = self._version_given
+        result._validate_values = self._validate_values
+        # The metadata and the columns are small: they are copied, so a change of the schema
+        # of the new grid does not change this grid
+        validate_fn = result._detect_or_validate
+        result.metadata = MetadataObject(validate_fn=validate_fn).bulk_load(self.metadata.items())
+        result.column = SortableDict().bulk_load(
+            (col_name, MetadataObject(validate_fn=validate_fn).bulk_load(col_meta.items()))
+            for col_name, col_meta in self.column.items())
+        result._row = rows
+        result._index = None
+        result._position = {}
+        # pylint: enable=protected-access
+        return result
+
+    def _position_of(self, entity: Entity) -> int:
+        """Return the position of an entity of the grid.
+        The positions are cached, and rebuilt only if the cache is not valid for this entity.
+        Args:
+            entity: An entity of the grid (the same object)
+        Returns:
+            The position of the entity
+        """
+        idx = self._position.get(id(entity))
+        if idx is None or idx >= len(self._row) or self._row[idx] is not entity:
+            self._position = {id(row): pos for pos, row in enumerate(self._row)}
+            idx = self._position[id(entity)]
+        return idx
+
     def _detect_or_validate(self, val: Any) -> bool:
         """Detect the version used from the row content, or validate against the
         version if given.
         """
-        if (val is NA) \
-                or isinstance(val, (list, dict, SortableDict, Grid)):
+        if self._validate_values and ((val is NA) or isinstance(val, (list, dict, SortableDict, Grid))):
             # Project Haystack 3.0 type.
             self._assert_version(VER_3_0)
         return True
@@ -633,3 +745,103 @@ class Grid(MutableSequence):  # pytlint: disable=too-many-ancestors
                 raise ValueError(
                     'Data type requires version %s' % version)
             self._version = version
+            self._validate_values = self.nearest_version < VER_3_0
+
+
+# noinspection PyArgumentList
+def _approx_check(version_1: Any, version_2: Any) -> bool:
+    """
+    Compare two values with a tolerance
+
+    Args:
+        version_1: value one
+        version_2: value two
+    Returns:
+        true if the values are approximately identical
+    """
+    value_type = type(version_1)
+    if value_type is type(version_2):
+        handler = _APPROX_HANDLERS.get(value_type)
+        if handler is not None:
+            return handler(version_1, version_2)
+    if isinstance(version_1, numbers.Number) and isinstance(version_2, numbers.Number):
+        # noinspection PyUnresolvedReferences
+        return abs(version_1 - version_2) < 0.000001
+    # pylint: disable=C0123
+    if value_type is not type(version_2) and \
+            not (isinstance(version_1, str) and isinstance(version_2, str)):
+        return False
+    # pylint: enable=C0123
+    if isinstance(version_1, datetime.time) and isinstance(version_2, datetime.time):
+        # noinspection PyArgumentList
+        return version_1.replace(microsecond=0) == version_2.replace(microsecond=0)
+    if isinstance(version_1, datetime.datetime) and isinstance(version_2, datetime.datetime):
+        dt1, dt2 = version_1.replace(tzinfo=pytz.UTC), version_2.replace(tzinfo=pytz.UTC)
+        return dt1.date() == dt2.date() and _approx_check(dt1.time(), dt2.time())
+    if isinstance(version_1, Quantity) and isinstance(version_2, Quantity):
+        return version_1.units == version_2.units and \
+               _approx_check(version_1.m, version_2.m)
+    if isinstance(version_1, Coordinate) and isinstance(version_2, Coordinate):
+        return _approx_check(version_1.latitude, version_2.latitude) and \
+               _approx_check(version_1.longitude, version_2.longitude)
+    if isinstance(version_1, dict) and isinstance(version_2, dict):
+        for key, val in version_1.items():
+            if not _approx_check(val, version_2.get(key, None)):
+                return False
+        for key, val in version_2.items():
+            if key not in version_1 and not _approx_check(version_1.get(key, None), val):
+                return False
+        return True
+    return version_1 == version_2
+
+
+def _approx_number(number_1: numbers.Number, number_2: numbers.Number) -> bool:
+    return abs(number_1 - number_2) < 0.000001
+
+
+def _approx_time(time_1: datetime.time, time_2: datetime.time) -> bool:
+    return time_1.replace(microsecond=0) == time_2.replace(microsecond=0)
+
+
+def _approx_datetime(datetime_1: datetime.datetime, datetime_2: datetime.datetime) -> bool:
+    dt1, dt2 = datetime_1.replace(tzinfo=pytz.UTC), datetime_2.replace(tzinfo=pytz.UTC)
+    return dt1.date() == dt2.date() and _approx_time(dt1.time(), dt2.time())
+
+
+def _approx_quantity(quantity_1: Quantity, quantity_2: Quantity) -> bool:
+    return quantity_1.units == quantity_2.units and \
+           _approx_check(quantity_1.m, quantity_2.m)
+
+
+def _approx_coordinate(coordinate_1: Coordinate, coordinate_2: Coordinate) -> bool:
+    return _approx_check(coordinate_1.latitude, coordinate_2.latitude) and \
+           _approx_check(coordinate_1.longitude, coordinate_2.longitude)
+
+
+def _approx_dict(dict_1: Dict[str, Any], dict_2: Dict[str, Any]) -> bool:
+    approx_check = _approx_check
+    for key, val in dict_1.items():
+        other_val = dict_2.get(key, None)
+        if val is other_val and not isinstance(val, (float, Quantity)):  # Shared value, except NaN
+            continue
+        if not approx_check(val, other_val):
+            return False
+    for key, val in dict_2.items():
+        if key not in dict_1 and not approx_check(None, val):
+            return False
+    return True
+
+
+# `_approx_check()` for two values of the same exact type
+_APPROX_HANDLERS: Dict[type, Callable[[Any, Any], bool]] = {
+    int: _approx_number,
+    float: _approx_number,
+    bool: _approx_number,
+    str: operator.eq,
+    Ref: operator.eq,
+    datetime.time: _approx_time,
+    datetime.datetime: _approx_datetime,
+    Quantity: _approx_quantity,
+    Coordinate: _approx_coordinate,
+    dict: _approx_dict,
+}
@@ -9,42 +9,46 @@
 Parse the filter syntax to produce a FilterAST.
 See https://www.project-haystack.org/doc/Filters
 """
-from datetime import datetime, date, time, timedelta, tzinfo
+import operator
+import re
+import sys
+from datetime import datetime, date, time, timedelta, tzinfo, timezone as fixed_timezone
 from functools import lru_cache
-from typing import Any, List, Callable, Tuple
+from typing import Any, List, Callable, Tuple, Optional, Sequence
 
-from pyparsing import ZeroOrMore, Literal, Forward, Suppress
+from pyparsing import ZeroOrMore, Forward, Suppress, ParseException, Regex, locatedExpr
 
 from . import Grid
-from .datatypes import Ref, XStr, MARKER, NA, REMOVE
+from .datatypes import Ref
 from .filter_ast import FilterPath, FilterBinary, FilterUnary, FilterAST, FilterNode
 from .type import Entity
 from .zincparser import hs_scalar_3_0, hs_id, hs_all_date, hs_date, \
-    hs_time, pyparser_lock
-
-# Necessary for generated code
-_ = XStr
-_ = MARKER
-_ = NA
-_ = REMOVE
+    hs_time, pyparser_lock, ZincParseException
 
 
 def _merge_and_or(key: str, toks: List[FilterBinary]) -> FilterBinary:
-    if len(toks) == 1:
-        return toks[0]
-    return FilterBinary(key, _merge_and_or(key, toks[:-2]), toks[-1])
+    # toks is [term, key, term, key, term...], merged from the left
+    terms = iter(toks)
+    node = next(terms)
+    for _, right in zip(terms, terms):
+        node = FilterBinary(key, node, right)
+    return node
+
 
+_CMP_OP = r'==|!=|<=|>=|<|>'
 
+# The packrat cache of pyparsing is not enabled: it is global to all the grammars,
+# and slows down the zinc parser. parse_filter() does not use this grammar.
 hs_filter = Forward()
-hs_bool = (Literal("true") | "false").setParseAction(
+hs_bool = Regex("true|false").setParseAction(
     lambda toks: toks[0] == "true"
 )  # Extension to accept T or F
 hs_val = hs_scalar_3_0 ^ hs_bool
 
 hs_path = (hs_id + ZeroOrMore(Suppress("->") + hs_id)).setParseAction(
-    lambda toks: FilterPath(list(toks))
+    lambda toks: FilterPath([sys.intern(tok) for tok in toks])
 )
-hs_cmpOp = Literal("==") | "!=" | "<=" | ">=" | "<" | ">"
+hs_cmpOp = Regex(_CMP_OP)
 hs_cmp = (hs_path + hs_cmpOp + hs_val).setParseAction(
     lambda toks: FilterBinary(toks[1], toks[0], toks[2])
 )
@@ -52,7 +56,7 @@ hs_missing = (Suppress("not") + hs_path).setParseAction(
     lambda toks: FilterUnary("not", toks[0])
 )
 hs_has = hs_path.copy().setParseAction(
-    lambda toks: FilterUnary("has", FilterPath(list(toks)))
+    lambda toks: FilterUnary("has", FilterPath([sys.intern(tok) for tok in toks]))
 )
 
 hs_parens = (Suppress("(") + hs_filter + Suppress(")")).setParseAction(
@@ -68,6 +72,134 @@ hs_condOr = (hs_condAnd + ZeroOrMore("or" + hs_condAnd)).setParseAction(
 )
 hs_filter <<= hs_condOr
 
+# --- Hand-written parser of the same grammar, used by parse_filter()
+_WHITESPACES_RE = re.compile(r'[ \t]*')
+_ID_RE = re.compile(r'[a-z][a-zA-Z0-9_]*')
+_ARROW_RE = re.compile(r'[ \t]*->[ \t]*')
+_CMP_OP_RE = re.compile(_CMP_OP)
+_KEYWORD_RE = re.compile(r'(and|or|not)(?![a-zA-Z0-9_])')
+# The frequent values, without the ambiguities resolved by the zinc grammar.
+# The other values are parsed with `hs_val`.
+_FAST_VAL_RE = re.compile(r'(?:(?P<bool>true|false)'
+                          r'|"(?P<str>[^"\\\x00-\x1f]*)"'
+                          r'|@(?P<ref>[a-zA-Z0-9_:\-.~]+)(?![ \t]*")'
+                          r'|(?P<date>\d{4}-\d{2}-\d{2})'
+                          r'|(?P<number>-?\d+(?:\.\d+)?))'
+                          r'(?=[ \t)]|$)')
+_hs_located_val = locatedExpr(hs_val)
+
+
+class _FilterParser:
+    """
+    A recursive-descent parser for the filter syntax.
+    Args:
+        grid_filter: The filter request
+    """
+    __slots__ = "text", "pos"
+
+    def __init__(self, grid_filter: str):
+        self.text = grid_filter
+        self.pos = 0
+
+    def _error(self, msg: str) -> ParseException:
+        return ParseException(self.text, self.pos, msg)
+
+    def _skip_whitespaces(self) -> None:
+        self.pos = _WHITESPACES_RE.match(self.text, self.pos).end()
+
+    def _keyword(self, keyword: str) -> bool:
+        self._skip_whitespaces()
+        match = _KEYWORD_RE.match(self.text, self.pos)
+        if match and match.group(1) == keyword:
+            self.pos = match.end()
+            return True
+        return False
+
+    def parse(self) -> FilterNode:
+        node = self._parse_or()
+        self._skip_whitespaces()
+        if self.pos != len(self.text):
+            raise self._error("Expected end of text")
+        return node
+
+    def _parse_or(self) -> FilterNode:
+        node = self._parse_and()
+        while self._keyword("or"):
+            node = FilterBinary("or", node, self._parse_and())
+        return node
+
+    def _parse_and(self) -> FilterNode:
+        node = self._parse_term()
+        while self._keyword("and"):
+            node = FilterBinary("and", node, self._parse_term())
+        return node
+
+    def _parse_term(self) -> FilterNode:
+        self._skip_whitespaces()
+        if self.text.startswith("(", self.pos):
+            self.pos += 1
+            node = self._parse_or()
+            self._skip_whitespaces()
+            if not self.text.startswith(")", self.pos):
+                raise self._error("Expected ')'")
+            self.pos += 1
+            return node
+        if self._keyword("not"):
+            return FilterUnary("not", self._parse_path())
+        path = self._parse_path()
+        self._skip_whitespaces()
+        match = _CMP_OP_RE.match(self.text, self.pos)
+        if not match:
+            return FilterUnary("has", path)
+        self.pos = match.end()
+        return FilterBinary(match.group(), path, self._parse_val())
+
+    def _parse_id(self) -> str:
+        match = _ID_RE.match(self.text, self.pos)
+        if not match:
+            raise self._error("Expected id")
+        self.pos = match.end()
+        return sys.intern(match.group())
+
+    def _parse_path(self) -> FilterPath:
+        self._skip_whitespaces()
+        paths = [self._parse_id()]
+        match = _ARROW_RE.match(self.text, self.pos)
+        while match:
+            self.pos = match.end()
+            paths.append(self._parse_id())
+            match = _ARROW_RE.match(self.text, self.pos)
+        return FilterPath(paths)
+
+    def _parse_val(self) -> Any:
+        self._skip_whitespaces()
+        match = _FAST_VAL_RE.match(self.text, self.pos)
+        if match:
+            self.pos = match.end()
+            kind = match.lastgroup
+            if kind == "number":
+                return float(match.group(kind))
+            if kind == "str":
+                return match.group(kind)
+            if kind == "ref":
+                return Ref(match.group(kind))
+            if kind == "bool":
+                return match.group(kind) == "true"
+            a_date = _fast_iso_date(match.group(kind))
+            if a_date is not None:
+                return a_date
+            self.pos = match.start()
+        try:
+            with pyparser_lock:
+                _, value, end = _hs_located_val.parseString(self.text[self.pos:])[0]
+        except ParseException as ex:
+            # The positions are relative to the remaining text
+            raise ParseException(self.text, self.pos + ex.loc, ex.msg) from ex
+        except ZincParseException as ex:
+            raise self._error(str(ex)) from ex
+        self.pos += end
+        return value
+
 
 def parse_filter(grid_filter: str) -> FilterAST:
     """Return an AST tree of filter. Can be used to generate other language
@@ -77,13 +209,14 @@ def parse_filter(grid_filter: str) -> FilterAST:
         grid_filter: A filter request
     Returns:
         A `FilterAST`
+    Raises:
+        `pyparsing.ParseException` if the filter does not conform
     """
-    with pyparser_lock:
-        return FilterAST(hs_filter.parseString(grid_filter, parseAll=True)[0])
+    return FilterAST(_FilterParser(grid_filter).parse())
 
 
 # --- Generate python to apply filter
-# Maximum number of generated python function
+# Maximum number of python functions in cache
 _FILTER_CACHE_LRU_SIZE = 500
 # Id of next generated function
 _ID_FUNCTION = 0  # pylint: disable=C0103
@@ -92,6 +225,7 @@ _ID_FUNCTION = 0  # pylint: disable=C0103
 class _NotFoundValue:
     """ Hack to easely manage the 'not found' value.
     All operators return `False`.
+    The functions of `filter_function()` check this value by identity, without these operators.
     """
 
     def __repr__(self):
@@ -122,7 +256,8 @@ class _NotFoundValue:
 NOT_FOUND = _NotFoundValue()
 
 
-def _get_path(grid: Grid, obj: Any, paths: List[str]) -> Any:
+def _get_path(grid: Grid, obj: Any, paths: Sequence[str],
+              not_found: Any = NOT_FOUND, ref_type: type = Ref) -> Any:
     """
     Return the value at a specific path.
 
@@ -130,21 +265,21 @@ def _get_path(grid: Grid, obj: Any, paths: List[str]) -> Any:
         grid: The root grid to use.
         obj: The current object
         paths: The path to apply
+        not_found: Local binding of `NOT_FOUND`
+        ref_type: Local binding of `Ref`
     Returns:
-        The value of the tag at this `path`
+        The value of the tag at this `path`, or `NOT_FOUND`
     """
-    try:
-        for i, path in enumerate(paths):
-            obj = obj[path]
-            if i != len(paths) - 1 and isinstance(obj, Ref):
-                obj = grid[obj]  # Follow the reference
-        if not obj:
-            return NOT_FOUND
-        return obj  # It's a value at this time
-    except TypeError:
-        return NOT_FOUND
-    except KeyError:
-        return NOT_FOUND
+    last = len(paths) - 1
+    for i, path in enumerate(paths):
+        if not isinstance(obj, dict):
+            return not_found
+        obj = obj.get(path)
+        if obj is None:
+            return not_found
+        if i != last and isinstance(obj, ref_type):
+            obj = grid.get(obj, not_found)  # Follow the reference
+    return obj  # It's a value at this time
 
 
 def _generate_filter_in_python(node: FilterNode, def_filter: List[str]) -> List[str]:
@@ -166,13 +301,13 @@ def _generate_filter_in_python(node: FilterNode, def_filter: List[str]) -> List[
         def_filter.append(")")
     elif isinstance(node, FilterUnary):
         if node.operator == "has":
-            def_filter.append('(id(')
+            def_filter.append('(')
             _generate_filter_in_python(node.right, def_filter)
-            def_filter.append(') !=  id(NOT_FOUND))')
+            def_filter.append(' is not NOT_FOUND)')
         elif node.operator == "not":
-            def_filter.append('(id(')
+            def_filter.append('(')
             _generate_filter_in_python(node.right, def_filter)
-            def_filter.append(") == id(NOT_FOUND))")
+            def_filter.append(" is NOT_FOUND)")
         else:  # pragma: no cover
             assert 0
     else:
@@ -180,31 +315,14 @@ def _generate_filter_in_python(node: FilterNode, def_filter: List[str]) -> List[
     return def_filter
 
 
-class _FnWrapper:
+def _filter_to_python(grid_filter: str) -> Tuple[str, str]:
     """
-    A wrapper to manage the lifecycle of generated python methods.
-    Can be used with @lru to remove the generated method if this wrapper is deleted.
+    Generate the python code of a filter, to show its semantic.
     Args:
-        fun_name: The function name to manage.
-        function_template: The body of the function.
+        grid_filter: The filter request
+    Returns:
+        The function name and the python code
     """
-    __slots__ = ("fun_name",)
-
-    def __init__(self, fun_name: str, function_template: str):
-        self.fun_name = fun_name
-        # Import the function inside Python engine
-        exec(function_template, globals(), globals())  # pylint: disable=W0122
-
-    def __del__(self) -> None:  # pragma: no cover
-        # Remove the corresponding python function from Python engine
-        del globals()[self.fun_name]  # Remove generated function if the LRU ask that
-
-    def get(self) -> Callable[[Grid, Entity], bool]:
-        # Gest the python function.
-        return globals()[self.fun_name]
-
-
-def _filter_to_python(grid_filter: str) -> Tuple[str, str]:
     global _ID_FUNCTION  # pylint: disable=global-statement
     def_filter = _generate_filter_in_python(
         parse_filter(grid_filter).head, [])  # pylint: disable=protected-access
@@ -214,17 +332,107 @@ def _filter_to_python(grid_filter: str) -> Tuple[str, str]:
     return func_name, function_template
 
 
+_OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+def _path_in_closure(paths: List[str]) -> Callable[[Grid, Entity], Any]:
+    """
+    Convert a path to a python function, specialized for the paths with only one tag.
+    Args:
+        paths: The path
+    Returns:
+        A function `(grid, entity)` to return the value at this path, or `NOT_FOUND`.
+    """
+    if len(paths) == 1:
+        tag = paths[0]
+
+        def _get_tag(_: Grid, entity: Entity) -> Any:
+            value = entity.get(tag)
+            return NOT_FOUND if value is None else value
+
+        return _get_tag
+    paths = tuple(paths)
+    return lambda grid, entity: _get_path(grid, entity, paths)
+
+
+def _filter_in_closure(node: FilterNode) -> Callable[[Grid, Entity], Any]:
+    """
+    Convert a node to a python function, with the same semantic as the generated python code.
+    Args:
+        node: Node to convert
+    Returns:
+        A function `(grid, entity)` to evaluate the node.
+    """
+    if isinstance(node, FilterPath):
+        return _path_in_closure(node.paths)
+    if isinstance(node, FilterBinary):
+        left = _filter_in_closure(node.left)
+        right = _filter_in_closure(node.right)
+        if node.operator == "and":
+            return lambda grid, entity: left(grid, entity) and right(grid, entity)
+        if node.operator == "or":
+            return lambda grid, entity: left(grid, entity) or right(grid, entity)
+        a_operator = _OPERATORS[node.operator]
+        if isinstance(node.left, FilterPath) and not isinstance(node.right, FilterNode):
+            value = node.right  # The usual `path op value`
+            if len(node.left.paths) == 1:
+                tag = node.left.paths[0]
+
+                def _compare_tag(_: Grid, entity: Entity) -> bool:
+                    left_value = entity.get(tag)
+                    return left_value is not None and a_operator(left_value, value)
+
+                return _compare_tag
+
+            def _compare_path(grid: Grid, entity: Entity) -> bool:
+                left_value = left(grid, entity)
+                return left_value is not NOT_FOUND and a_operator(left_value, value)
+
+            return _compare_path
+
+        def _compare(grid: Grid, entity: Entity) -> bool:
+            left_value = left(grid, entity)
+            if left_value is NOT_FOUND:
+                return False
+            right_value = right(grid, entity)
+            return right_value is not NOT_FOUND and a_operator(left_value, right_value)
+
+        return _compare
+    if isinstance(node, FilterUnary):
+        paths = node.right.paths  # Always a path
+        if len(paths) == 1:
+            tag = paths[0]
+            if node.operator == "has":
+                return lambda grid, entity: entity.get(tag) is not None
+            if node.operator == "not":
+                return lambda grid, entity: entity.get(tag) is None
+        else:
+            get_path = _path_in_closure(paths)
+            if node.operator == "has":
+                return lambda grid, entity: get_path(grid, entity) is not NOT_FOUND
+            if node.operator == "not":
+                return lambda grid, entity: get_path(grid, entity) is NOT_FOUND
+        assert 0  # pragma: no cover
+    return lambda grid, entity: node
+
+
 @lru_cache(maxsize=_FILTER_CACHE_LRU_SIZE)
-def _filter_function(grid_filter: str) -> _FnWrapper:
+def _filter_function(grid_filter: str) -> Callable[[Grid, Entity], bool]:
     """
-    Generate and manage the life cycle of generation python function.
+    Convert the request filter to a python function.
     Args:
         grid_filter: The filter request
     Returns:
-        A wrapper to manage the life cycle of generated function
+        The corresponding python function
     """
-    func_name, function_template = _filter_to_python(grid_filter)
-    return _FnWrapper(func_name, function_template)
+    return _filter_in_closure(parse_filter(grid_filter).head)
 
 
 def filter_set_lru_size(lru_size: int) -> None:
@@ -249,7 +457,97 @@ def filter_function(grid_filter: str) -> Callable[[Grid, Entity], bool]:
     Returns:
         The corresponding python function to apply to the grid
     """
-    return _filter_function(grid_filter).get()
+    return _filter_function(grid_filter)
+
+
+# Maximum number of parsed dates and times in cache
+_DATE_CACHE_SIZE = 1024
+
+
+def _fast_iso_time(time_str: str) -> Optional[time]:
+    """
+    Parse the `hh:mm[:ss[.fff]]` time with the fixed positions of the fields.
+    Args:
+        time_str: The string to parse
+    Returns:
+        The corresponding `time` or None if the string has another shape
+    """
+    size = len(time_str)
+    if size < 5 or time_str[2] != ':' or not time_str.isascii():
+        return None
+    second = micro = 0
+    if size > 5:
+        if size < 8 or time_str[5] != ':' or not time_str[6:8].isdigit():
+            return None
+        second = int(time_str[6:8])
+        if size > 8:
+            fraction = time_str[9:]
+            if time_str[8] != '.' or not 0 < len(fraction) <= 6 or not fraction.isdigit():
+                return None
+            micro = int(fraction.ljust(6, '0'))
+    if not (time_str[0:2].isdigit() and time_str[3:5].isdigit()):
+        return None
+    try:
+        return time(int(time_str[0:2]), int(time_str[3:5]), second, micro)
+    except ValueError:
+        return None
+
+
+def _fast_iso_date(date_str: str) -> Optional[date]:
+    """
+    Parse the `YYYY-MM-DD` date with the fixed positions of the fields.
+    Args:
+        date_str: The string to parse
+    Returns:
+        The corresponding `date` or None if the string has another shape
+    """
+    if len(date_str) != 10 or date_str[4] != '-' or date_str[7] != '-' \
+            or not date_str.isascii() \
+            or not (date_str[0:4].isdigit() and date_str[5:7].isdigit() and date_str[8:10].isdigit()):
+        return None
+    try:
+        return date(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
+    except ValueError:
+        return None
+
+
+def _fast_iso_datetime(datetime_str: str) -> Optional[datetime]:
+    """
+    Parse the `YYYY-MM-DDThh:mm[:ss[.fff]][Z|+hh:mm]` date time, without time zone name,
+    with the fixed positions of the fields.
+    Args:
+        datetime_str: The string to parse
+    Returns:
+        The corresponding `datetime` or None if the string has another shape
+    """
+    if len(datetime_str) < 16 or datetime_str[10] not in 'Tt':
+        return None
+    a_date = _fast_iso_date(datetime_str[0:10])
+    if a_date is None:
+        return None
+    end = 16
+    if datetime_str[end:end + 1] == ':':
+        end += 3
+        if datetime_str[end:end + 1] == '.':
+            end += 1
+            while datetime_str[end:end + 1].isdigit():
+                end += 1
+    offset = datetime_str[end:]
+    if not offset or offset in ('Z', 'z'):
+        a_tz = fixed_timezone.utc
+    elif len(offset) == 6 and offset[0] in '+-' and offset[3] == ':' \
+            and offset[1:3].isdigit() and offset[4:6].isdigit():
+        delta = timedelta(hours=int(offset[1:3]), minutes=int(offset[4:6]))
+        a_tz = fixed_timezone(-delta if offset[0] == "-" else delta, offset)
+    else:
+        return None
+    time_str = datetime_str[11:end]
+    if len(time_str) > 15:  # More digits than microseconds are truncated
+        time_str = time_str[0:15]
+    a_time = _fast_iso_time(time_str)
+    if a_time is None:
+        return None
+    return datetime.combine(a_date, a_time, tzinfo=a_tz)
 
 
 def parse_hs_datetime_format(datetime_str: str, timezone: tzinfo) -> datetime:
@@ -269,12 +567,19 @@ def parse_hs_datetime_format(datetime_str: str, timezone: tzinfo) -> datetime:
     if datetime_str == "yesterday":
         return datetime.combine(date.today() - timedelta(days=1), datetime.min.time()) \
             .replace(tzinfo=timezone)
-    if datetime_str == "today":
-        return datetime.combine(date.today(), datetime.min.time()) \
-            .replace(tzinfo=timezone)
+    return _parse_hs_datetime(datetime_str)
+
+
+@lru_cache(maxsize=_DATE_CACHE_SIZE)
+def _parse_hs_datetime(datetime_str: str) -> datetime:
+    # The values are immutable, and do not depend on the current date
+    fast_datetime = _fast_iso_datetime(datetime_str)
+    if fast_datetime is not None:
+        return fast_datetime
     return hs_all_date.parseString(datetime_str, parseAll=True)[0]
 
 
+@lru_cache(maxsize=_DATE_CACHE_SIZE)
 def parse_hs_date_format(date_str) -> date:
     """
     Parse the haystack date (for filter).
@@ -285,9 +590,13 @@ def parse_hs_date_format(date_str) -> date:
     Raises:
         `pyparsing.ParseException` if the string does not conform
     """
+    fast_date = _fast_iso_date(date_str)
+    if fast_date is not None:
+        return fast_date
     return hs_date.parseString(date_str, parseAll=True)[0]
 
 
+@lru_cache(maxsize=_DATE_CACHE_SIZE)
 def parse_hs_time_format(time_str) -> time:
     """
     Parse the haystack date (for filter).
@@ -298,4 +607,7 @@ def parse_hs_time_format(time_str) -> time:
     Raises:
         `pyparsing.ParseException` if the string does not conform
     """
+    fast_time = _fast_iso_time(time_str)
+    if fast_time is not None:
+        return fast_time
     return hs_time.parseString(time_str, parseAll=True)[0]
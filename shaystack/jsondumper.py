@@ -228,3 +228,16 @@ def dump_scalar(scalar: Any, version: Version = LATEST_VER) -> str:
         The JSON string
     """
     return json.dumps(_dump_scalar(scalar, version))
+
+
+def dump_scalar_to_jsonable(scalar: Any, version: Version = LATEST_VER) \
+        -> Union[None, str, bool, List[str], Entity]:
+    """
+    Dump a scalar to the python structure of the JSON format, without serialize it
+    Args:
+        scalar: The scalar value
+        version: The Haystack version
+    Returns:
+        The python value, ready for `json.dumps()`
+    """
+    return _dump_scalar(scalar, version)
@@ -31,6 +31,14 @@ from .type import Entity
 from .version import LATEST_VER, Version, VER_3_0
 from .zoneinfo import timezone
 
+try:
+    # Optional C accelerated JSON codec
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 URI_META = re.compile(r'([:/?#[\]@&=;"$`])')
 GRID_SEP = re.compile(r'\n\n+')
 
@@ -58,6 +66,22 @@ COORD_RE = re.compile(r'c:(-?\d*\.?\d*),(-?\d*\.?\d*)$',
 STR_ESC_RE = re.compile(r'\\([bfnrt"\\$]|u[0-9a-fA-F]{4})')
 
 
+def _json_loads(json_str: str) -> Any:
+    """
+    Parse a JSON string, with `orjson` if it's available.
+    Args:
+        json_str: The JSON string
+    Returns:
+        The python structure
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(json_str)
+        except orjson.JSONDecodeError:  # NaN, big integers... are accepted by `json`
+            pass
+    return json.loads(json_str)
+
+
 def _parse_metadata(meta: Entity, version: Version) -> MetadataObject:
     metadata = MetadataObject()
     for name, value in meta.items():
@@ -73,7 +97,7 @@ def _parse_cols(grid: Grid, parsed: List[Entity], version: Version) -> None:
             value = _parse_embedded_scalar(value, version=version)
             if value is not None:
                 meta[key] = value
-        grid.column[name] = meta
+        grid.column[sys.intern(name)] = meta
 
 
 def _parse_row(row: Dict[str, Any], version: Version) -> Entity:
@@ -81,7 +105,7 @@ def _parse_row(row: Dict[str, Any], version: Version) -> Entity:
     for col, value in row.items():
         value = _parse_embedded_scalar(value, version=version)
         if value is not None:
-            parsed_row[col] = value
+            parsed_row[sys.intern(col)] = value
     return parsed_row
 
 
@@ -233,7 +257,7 @@ def parse_scalar(scalar: Union[str, bool, float, int, list, dict], version: Vers
             (len(scalar) >= 2) and \
             (scalar[0] in ('"', '[', '{')) and \
             (scalar[-1] in ('"', ']', '}')):
-        scalar = json.loads(scalar)
+        scalar = _json_loads(scalar)
 
     return _parse_embedded_scalar(scalar, version=version)
 
@@ -247,7 +271,7 @@ def parse_grid(grid_str: Union[str, Dict[str, Any]]) -> Grid:
         The corresponding grid.
     """
     if isinstance(grid_str, str):
-        parsed = json.loads(grid_str)
+        parsed = _json_loads(grid_str)
     else:
         parsed = copy.deepcopy(grid_str)
     meta = parsed.pop('meta')
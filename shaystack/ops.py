@@ -539,7 +539,7 @@ def nav(envs: Dict[str, str], request: HaystackHttpRequest, stage: str) -> Hayst
         if args:
             if "navId" in args:
                 nav_id = args["navId"]
-        grid_response = provider.nav(nav_id=nav_id)
+        grid_response = provider.nav(nav_id)
         assert grid_response is not None
         response = _format_response(headers, grid_response, 200, "OK")
     except Exception as ex:  # pylint: disable=broad-except
@@ -128,6 +128,16 @@ class Provider(DBHaystackInterface):
         """ Implement Haystack 'hisRead' """
         return self._delegate.his_read(entity_id, dates_range, date_version)
 
+    @overrides
+    def his_read_many(
+            self,
+            entity_ids: List[Ref],
+            dates_range: Tuple[datetime, datetime],
+            date_version: Optional[datetime] = None,
+    ) -> List[Grid]:
+        """ Read the time series of many entities """
+        return self._delegate.his_read_many(entity_ids, dates_range, date_version)
+
     @overrides
     def create_db(self) -> None:
         """
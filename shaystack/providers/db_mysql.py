@@ -357,6 +357,12 @@ def _exec_sql_filter(params: Dict[str, Any],
     return cursor
 
 
+def _insert_entities(params: Dict[str, Any],
+                     cursor,
+                     entities: List[Tuple]) -> None:
+    cursor.executemany(params["INSERT_ENTITY"], entities)
+
+
 def get_db_parameters(database_name: str, table_name: str) -> Dict[str, Union[Callable, str]]:
     """ Return the SQL request and some lambda to manipulate a SuperSQLite database.
 
@@ -369,6 +375,7 @@ def get_db_parameters(database_name: str, table_name: str) -> Dict[str, Union[Ca
     return {
         "sql_type_to_json": json.loads,
         "exec_sql_filter": _exec_sql_filter,
+        "insert_entities": _insert_entities,
         "field_to_datetime_tz": lambda val: val.replace(tzinfo=pytz.utc),
         "datetime_tz_to_field": lambda dt: datetime(dt.year, dt.month, dt.day,
                                                     dt.hour, dt.minute, dt.second, dt.microsecond,
@@ -496,6 +503,14 @@ def get_db_parameters(database_name: str, table_name: str) -> Dict[str, Union[Ca
             AND date_time BETWEEN %s AND %s 
             ORDER BY date_time
             '''),
+        "ids_to_param": tuple,
+        "SELECT_TS_WITH_IDS": textwrap.dedent(f'''
+            SELECT id,date_time,val FROM {table_name}_ts
+            WHERE customer_id = %s
+            AND id IN %s
+            AND date_time BETWEEN %s AND %s
+            ORDER BY id,date_time
+            '''),
         "PURGE_TABLES_TS": textwrap.dedent(f'''
             DELETE FROM {table_name}_ts
             ''')
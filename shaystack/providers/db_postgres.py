@@ -481,6 +481,24 @@ def _exec_sql_filter(params: Dict[str, Any],
 MAX_DATE = '9999-12-31T23:59:59'
 
 
+def _insert_entities(params: Dict[str, Any],
+                     cursor,
+                     entities: List[Tuple]) -> None:
+    # With psycopg2, one multi-rows INSERT for each page, in place of one INSERT for each entity.
+    # The other drivers (`postgresql+<driver>://`) use the DB-API executemany()
+    try:
+        from psycopg2.extensions import cursor as psycopg2_cursor  # pylint: disable=import-outside-toplevel
+        from psycopg2.extras import execute_values  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        psycopg2_cursor = None
+    if psycopg2_cursor and isinstance(cursor, psycopg2_cursor):
+        execute_values(cursor, params["INSERT_ENTITIES"], entities,
+                       template="(%s,%s,%s,'9999-12-31T23:59:59',%s)",
+                       page_size=128)
+    else:
+        cursor.executemany(params["INSERT_ENTITY"], entities)
+
+
 def get_db_parameters(table_name: str) -> Dict[str, Union[Callable, str]]:
     """ Return the SQL request and some lambda to manipulate a Postgres database.
 
@@ -492,6 +510,7 @@ def get_db_parameters(table_name: str) -> Dict[str, Union[Callable, str]]:
     return {
         "sql_type_to_json": lambda x: x,
         "exec_sql_filter": _exec_sql_filter,
+        "insert_entities": _insert_entities,
         "field_to_datetime_tz": lambda val: val,
         "datetime_tz_to_field": lambda dt: dt,
         "CREATE_HAYSTACK_TABLE": textwrap.dedent(f'''
@@ -562,6 +581,9 @@ def get_db_parameters(table_name: str) -> Dict[str, Union[Callable, str]]:
         "INSERT_ENTITY": textwrap.dedent(f'''
             INSERT INTO {table_name} VALUES (%s,%s,%s,'9999-12-31T23:59:59',%s)
             '''),
+        "INSERT_ENTITIES": textwrap.dedent(f'''
+            INSERT INTO {table_name} VALUES %s
+            '''),
         "DISTINCT_VERSION": textwrap.dedent(f'''
             SELECT DISTINCT start_datetime
             FROM {table_name}
@@ -603,6 +625,14 @@ def get_db_parameters(table_name: str) -> Dict[str, Union[Callable, str]]:
             AND date_time BETWEEN %s AND %s
             ORDER BY date_time
             '''),
+        "ids_to_param": list,
+        "SELECT_TS_WITH_IDS": textwrap.dedent(f'''
+            SELECT id,date_time,val FROM {table_name}_ts
+            WHERE customer_id = %s
+            AND id = ANY(%s)
+            AND date_time BETWEEN %s AND %s
+            ORDER BY id,date_time
+            '''),
         "PURGE_TABLES_TS": textwrap.dedent(f'''
             DELETE FROM {table_name}_ts
             ''')
@@ -350,6 +350,12 @@ def _exec_sql_filter(params: Dict[str, Any],
     return cursor
 
 
+def _insert_entities(params: Dict[str, Any],
+                     cursor,
+                     entities: List[Tuple]) -> None:
+    cursor.executemany(params["INSERT_ENTITY"], entities)
+
+
 def get_db_parameters(table_name: str) -> Dict[str, Union[Callable, str]]:
     """ Return the SQL request and some lambda to manipulate a SuperSQLite database.
 
@@ -361,6 +367,7 @@ def get_db_parameters(table_name: str) -> Dict[str, Union[Callable, str]]:
     return {
         "sql_type_to_json": json.loads,
         "exec_sql_filter": _exec_sql_filter,
+        "insert_entities": _insert_entities,
         "field_to_datetime_tz": lambda val:
         datetime.datetime.strptime(val, "%Y-%m-%d %H:%M:%S").replace(tzinfo=pytz.utc),
         "datetime_tz_to_field": lambda dt: datetime.datetime(dt.year, dt.month, dt.day,
@@ -471,6 +478,14 @@ def get_db_parameters(table_name: str) -> Dict[str, Union[Callable, str]]:
             AND datetime(date_time) BETWEEN datetime(?) AND datetime(?) 
             ORDER BY datetime(date_time)
             '''),
+        "ids_to_param": json.dumps,
+        "SELECT_TS_WITH_IDS": textwrap.dedent(f'''
+            SELECT id,date_time,val FROM {table_name}_ts
+            WHERE customer_id = ?
+            AND id IN (SELECT value FROM json_each(?))
+            AND datetime(date_time) BETWEEN datetime(?) AND datetime(?)
+            ORDER BY id,datetime(date_time)
+            '''),
         "PURGE_TABLES_TS": textwrap.dedent(f'''
             DELETE FROM {table_name}_ts
             ''')
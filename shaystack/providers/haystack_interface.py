@@ -9,10 +9,12 @@ Base of haystack implementation.
 """
 import logging
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, date, timedelta, tzinfo
+from functools import lru_cache, wraps
 from importlib import import_module
-from typing import Any, Tuple, Dict, Optional, List, cast
+from typing import Any, Tuple, Dict, Optional, List, Callable, cast
 
 import pytz
 from pytz import BaseTzInfo
@@ -24,12 +26,92 @@ from ..grid_filter import parse_hs_datetime_format
 
 log = logging.getLogger("shaystack")
 
+# Maximum number of parallel `his_read` in the default `his_read_many`
+_HIS_READ_MANY_WORKERS = 8
 
+
+@lru_cache(maxsize=256)
 def _to_camel(snake_str: str) -> str:
     first, *others = snake_str.split("_")
     return "".join([first.lower(), *map(str.title, others)])
 
 
+_ABOUT_COLUMNS = [
+    "haystackVersion",  # Str version of REST implementation
+    "tz",  # Str of server's default timezone
+    "serverName",  # Str name of the server or project database
+    "serverTime",
+    "serverBootTime",
+    "productName",  # Str name of the server software product
+    "productUri",
+    "productVersion",
+    # module which implements Haystack server protocol
+    "moduleName",
+    # if its a plug-in to the product
+    "moduleVersion"  # Str version of moduleName
+]
+_SERVER_BOOT_TIME = datetime.now(tz=pytz.utc).replace(microsecond=0)
+
+# Name and summary of all the haystack operations
+_ALL_HAYSTACK_OPS = {
+    "about": "Summary information for server",
+    "ops": "Operations supported by this server",
+    "formats": "Grid data formats supported by this server",
+    "read": "The read op is used to read a set of entity records either by their unique "
+            "identifier or using a filter.",
+    "nav": "The nav op is used navigate a project for learning and discovery",
+    "watch_sub": "The watch_sub operation is used to create new watches "
+                 "or add entities to an existing watch.",
+    "watch_unsub": "The watch_unsub operation is used to close a watch entirely "
+                   "or remove entities from a watch.",
+    "watch_poll": "The watch_poll operation is used to poll a watch for "
+                  "changes to the subscribed entity records.",
+    "point_write": "The point_write_read op is used to: read the current status of a "
+                   "writable point's priority array "
+                   "or write to a given level",
+    "his_read": "The his_read op is used to read a time-series data "
+                "from historized point.",
+    "his_write": "The his_write op is used to post new time-series "
+                 "data to a historized point.",
+    "invoke_action": "The invoke_action op is used to invoke a "
+                     "user action on a target record.",
+}
+_ALL_HAYSTACK_OPS_CAMEL = {_to_camel(k): v for k, v in _ALL_HAYSTACK_OPS.items()}
+
+# The 'ops' grid of each provider class
+_OPS_CACHE: Dict[type, Grid] = {}
+
+
+def _build_ops(provider_class: type) -> Grid:
+    """ Build the 'ops' grid with the operations implemented by a provider class.
+
+    Args:
+        provider_class: The concrete class of the provider
+    Returns:
+        A Grid containing 'ops' name operations and its related description
+    """
+    # noinspection PyUnresolvedReferences
+    abstract_methods = provider_class.__base__.__abstractmethods__
+    removed = {_to_camel(method) for method in abstract_methods}
+    if "point_write_read" in abstract_methods or "point_write_write" in abstract_methods:
+        removed.add("pointWrite")
+    grid = Grid(
+        version=VER_3_0,
+        columns={
+            "name": {},
+            "summary": {},
+        },
+    )
+    grid.extend(
+        [
+            {"name": name, "summary": summary}
+            for name, summary in _ALL_HAYSTACK_OPS_CAMEL.items()
+            if name not in removed
+        ]
+    )
+    return grid
+
+
 @dataclass
 class HttpError(Exception):
     """
@@ -115,32 +197,15 @@ class HaystackInterface(ABC):
         Returns:
             The default 'about' grid.
         """
-        grid = Grid(
-            version=VER_3_0,
-            columns=[
-                "haystackVersion",  # Str version of REST implementation
-                "tz",  # Str of server's default timezone
-                "serverName",  # Str name of the server or project database
-                "serverTime",
-                "serverBootTime",
-                "productName",  # Str name of the server software product
-                "productUri",
-                "productVersion",
-                # module which implements Haystack server protocol
-                "moduleName",
-                # if its a plug-in to the product
-                "moduleVersion"  # Str version of moduleName
-            ],
-        )
+        server_tz = self.get_tz()
+        grid = Grid(version=VER_3_0, columns=_ABOUT_COLUMNS)
         grid.append(
             {
                 "haystackVersion": str(VER_3_0),
-                "tz": str(self.get_tz()),
+                "tz": str(server_tz),
                 "serverName": "haystack_" + self._envs.get("AWS_REGION", "local"),
-                "serverTime": datetime.now(tz=self.get_tz()).replace(microsecond=0),
-                "serverBootTime": datetime.now(tz=self.get_tz()).replace(
-                    microsecond=0
-                ),
+                "serverTime": datetime.now(tz=server_tz).replace(microsecond=0),
+                "serverBootTime": _SERVER_BOOT_TIME.astimezone(server_tz),
                 "productName": "Haystack Provider",
                 "productUri": Uri(home),
                 "productVersion": "0.1",
@@ -160,54 +225,11 @@ class HaystackInterface(ABC):
         Returns:
             A Grid containing 'ops' name operations and its related description
         """
-        grid = Grid(
-            version=VER_3_0,
-            columns={
-                "name": {},
-                "summary": {},
-            },
-        )
-        all_haystack_ops = {
-            "about": "Summary information for server",
-            "ops": "Operations supported by this server",
-            "formats": "Grid data formats supported by this server",
-            "read": "The read op is used to read a set of entity records either by their unique "
-                    "identifier or using a filter.",
-            "nav": "The nav op is used navigate a project for learning and discovery",
-            "watch_sub": "The watch_sub operation is used to create new watches "
-                         "or add entities to an existing watch.",
-            "watch_unsub": "The watch_unsub operation is used to close a watch entirely "
-                           "or remove entities from a watch.",
-            "watch_poll": "The watch_poll operation is used to poll a watch for "
-                          "changes to the subscribed entity records.",
-            "point_write": "The point_write_read op is used to: read the current status of a "
-                           "writable point's priority array "
-                           "or write to a given level",
-            "his_read": "The his_read op is used to read a time-series data "
-                        "from historized point.",
-            "his_write": "The his_write op is used to post new time-series "
-                         "data to a historized point.",
-            "invoke_action": "The invoke_action op is used to invoke a "
-                             "user action on a target record.",
-        }
-        # Remove abstract method
-        # noinspection PyUnresolvedReferences
-        for abstract_method in self.__class__.__base__.__abstractmethods__:
-            all_haystack_ops.pop(abstract_method, None)
-        if (
-                "point_write_read" in self.__class__.__base__.__abstractmethods__
-                or "point_write_write" in self.__class__.__base__.__abstractmethods__
-        ):
-            all_haystack_ops.pop("point_write", None)
-        all_haystack_ops = {_to_camel(k): v for k, v in all_haystack_ops.items()}
-
-        grid.extend(
-            [
-                {"name": name, "summary": summary}
-                for name, summary in all_haystack_ops.items()
-            ]
-        )
-        return grid
+        # The implemented operations are fixed by the class, so the grid is built only once
+        grid = _OPS_CACHE.get(type(self))
+        if grid is None:
+            grid = _OPS_CACHE[type(self)] = _build_ops(type(self))
+        return grid.copy()  # The callers may update the result, never the cached grid
 
     def formats(self) -> Optional[Grid]:  # pylint: disable=no-self-use
         """ Implement the Haystack 'formats' ops.
@@ -375,6 +397,32 @@ class HaystackInterface(ABC):
         """
         raise NotImplementedError()
 
+    def his_read_many(
+            self,
+            entity_ids: List[Ref],
+            dates_range: Tuple[datetime, datetime],
+            date_version: Optional[datetime] = None,
+    ) -> List[Grid]:
+        """ Read the time series of many entities.
+
+        Notes:
+            The default implementation calls `his_read` for each entity, in parallel threads.
+            Override this method to read all the time series with one request.
+
+        Args:
+            entity_ids: The entities to read
+            dates_range: The dates range, like for `his_read`
+            date_version: The optional date version to read
+
+        Returns:
+            A grid for each entity, in the same order
+        """
+        if len(entity_ids) <= 1:
+            return [self.his_read(entity_id, dates_range, date_version) for entity_id in entity_ids]
+        with ThreadPoolExecutor(max_workers=min(len(entity_ids), _HIS_READ_MANY_WORKERS)) as executor:
+            return list(executor.map(lambda entity_id: self.his_read(entity_id, dates_range, date_version),
+                                     entity_ids))
+
     @abstractmethod
     def his_write(
             self,
@@ -416,7 +464,7 @@ class HaystackInterface(ABC):
         raise NotImplementedError()
 
 
-_providers = {}
+_providers: Dict[str, HaystackInterface] = {}
 
 
 def no_cache():
@@ -425,6 +473,46 @@ def no_cache():
 
 
 # noinspection PyProtectedMember,PyUnresolvedReferences
+def _implement(abstract_method: Callable) -> Callable:
+    """Return a concrete method that delegates to an abstract method.
+    Args:
+        abstract_method: The abstract method
+
+    Returns:
+        A method with the same signature, not marked as abstract.
+    """
+
+    @wraps(abstract_method, updated=())  # Without the __isabstractmethod__ attribute
+    def implementation(self, *args, **kwargs):
+        return abstract_method(self, *args, **kwargs)
+
+    return implementation
+
+
+@lru_cache(maxsize=None)
+def _full_interface(class_str: str) -> type:
+    """Import the provider class and create a subclass with all the implementation.
+
+    Args:
+        class_str: The name of the provider class, with its module.
+
+    Returns:
+        The subclass of the provider class.
+    """
+    module_path, class_name = class_str.rsplit(".", 1)
+    module = import_module(module_path)
+    # Get the abstract class name
+    provider_class = getattr(module, class_name)
+
+    # Implement all abstract method.
+    # Then, it's possible to generate the Ops operator dynamically.
+    # Only the abstract methods are implemented, so the other methods are called without an
+    # additional frame.
+    return type("FullInterface", (provider_class,),
+                {name: _implement(getattr(provider_class, name))
+                 for name in provider_class.__abstractmethods__})
+
+
 def get_provider(class_str: str, envs: Dict[str, str],  # pylint: disable=protected-access
                  use_cache=True  # pylint: disable=protected-access
                  ) -> HaystackInterface:
@@ -443,103 +531,11 @@ def get_provider(class_str: str, envs: Dict[str, str],  # pylint: disable=protec
     """
     if not class_str.endswith(".Provider"):
         class_str += ".Provider"
-    if use_cache and class_str in _providers:
-        return _providers[class_str]
-    module_path, class_name = class_str.rsplit(".", 1)
-    module = import_module(module_path)
-    # Get the abstract class name
-    provider_class = getattr(module, class_name)
-
-    # Implement all abstract method.
-    # Then, it's possible to generate the Ops operator dynamically
-    # pylint: disable=missing-function-docstring,useless-super-delegation
-    # noinspection PyShadowingNames
-    class FullInterface(provider_class):  # pylint: disable=missing-class-docstring
-        def __init__(self, envs: Dict[str, str]):
-            provider_class.__init__(self, envs)
-
-        def name(self) -> str:
-            return super().name()
-
-        def about(
-                self, home: str
-        ) -> Grid:  # pylint: disable=missing-function-docstring,useless-super-delegation
-            return super().about(home)
-
-        def read(
-                self,
-                limit: int,
-                select: Optional[str],
-                entity_ids: Optional[List[Ref]],
-                grid_filter: Optional[str],
-                date_version: Optional[datetime],
-        ) -> Grid:
-            # pylint: disable=missing-function-docstring,useless-super-delegation
-            return super().read(limit, select, entity_ids, grid_filter, date_version)
-
-        def nav(self, nav_id: str) -> Any:
-            # pylint: disable=missing-function-docstring,useless-super-delegation
-            return super().nav(nav_id)
-
-        def watch_sub(
-                self,
-                watch_dis: str,
-                watch_id: Optional[str],
-                ids: List[Ref],
-                lease: Optional[int],
-        ) -> Grid:
-            # pylint: disable=missing-function-docstring,useless-super-delegation
-            return super().watch_sub(watch_dis, watch_id, ids, lease)
-
-        def watch_unsub(
-                self, watch_id: str, ids: List[Ref], close_all: bool
-        ) -> None:
-            # pylint: disable=missing-function-docstring,useless-super-delegation
-            return super().watch_unsub(watch_id, ids, close_all)
-
-        def watch_poll(self, watch_id: str, refresh: bool) -> Grid:
-            return super().watch_poll(watch_id, refresh)
-
-        def point_write_read(  # pylint: disable=missing-function-docstring,useless-super-delegation
-                self, entity_id: Ref, date_version: Optional[datetime]
-        ) -> Grid:
-            return super().point_write_read(entity_id, date_version)
-
-        def point_write_write(  # pylint: disable=missing-function-docstring,useless-super-delegation
-                self,
-                entity_id: Ref,
-                level: int,
-                val: Optional[Any],
-                duration: Quantity,
-                who: Optional[str],
-                date_version: Optional[datetime],
-        ) -> None:  # pylint: disable=no-self-use
-            return super().point_write_write(
-                entity_id, level, val, duration, who, date_version
-            )
-
-        def his_read(  # pylint: disable=missing-function-docstring,useless-super-delegation
-                self,
-                entity_id: Ref,
-                date_range: Optional[Tuple[datetime, datetime]],
-                date_version: Optional[datetime],
-        ) -> Grid:
-            return super().his_read(entity_id, date_range, date_version)
-
-        def his_write(  # pylint: disable=missing-function-docstring, useless-super-delegation
-                self, entity_id: Ref, time_serie: Grid, date_version: Optional[datetime]
-        ) -> Grid:
-            return super().his_write(entity_id, time_serie, date_version)
-
-        def invoke_action(  # pylint: disable=missing-function-docstring,useless-super-delegation
-                self,
-                entity_id: Ref,
-                action: str,
-                params: Dict[str, Any],
-        ) -> Grid:
-            return super().invoke_action(entity_id, action, params)
-
-    _providers[class_str] = FullInterface(envs)
+    if use_cache:
+        provider = _providers.get(class_str)
+        if provider is not None:
+            return provider
+    _providers[class_str] = _full_interface(class_str)(envs)
     return _providers[class_str]
 
 
@@ -555,15 +551,35 @@ def get_singleton_provider(envs: Dict[str, str]  # pylint: disable=protected-acc
         The current provider for the process.
     """
     global SINGLETON_PROVIDER  # pylint: disable=global-statement
+    if SINGLETON_PROVIDER is not None and not no_cache():
+        return SINGLETON_PROVIDER
     provider = envs.get("HAYSTACK_PROVIDER", "shaystack.providers.db")
-    if not SINGLETON_PROVIDER or no_cache():
-        log.debug("Provider=%s", provider)
-        SINGLETON_PROVIDER = get_provider(provider, envs)
+    log.debug("Provider=%s", provider)
+    SINGLETON_PROVIDER = get_provider(provider, envs)
     return SINGLETON_PROVIDER
 
 
 _DATETIME_MIN_TZ = datetime.min.replace(tzinfo=pytz.utc)
 _DATETIME_MAX_TZ = datetime.max.replace(tzinfo=pytz.utc)
+_MIDNIGHT = datetime.min.time()
+_END_OF_DAY = datetime.max.time()
+_ONE_DAY = timedelta(days=1)
+
+
+@lru_cache(maxsize=16)
+def _day_range(day: date, timezone: tzinfo) -> Tuple[datetime, datetime]:
+    """
+    Return the range of a day. The result is cached, because the bounds of
+    `today` and `yesterday` change only once a day.
+    Args:
+        day: The day.
+        timezone: The time-zone of the day.
+
+    Returns:
+        A tuple with the begin (inclusive) and end datetime (exclusive).
+    """
+    start = datetime.combine(day, _MIDNIGHT).replace(tzinfo=timezone)
+    return start, start + _ONE_DAY
 
 
 def parse_date_range(date_range: str, timezone: tzinfo) -> Tuple[datetime, datetime]:
@@ -580,69 +596,58 @@ def parse_date_range(date_range: str, timezone: tzinfo) -> Tuple[datetime, datet
         return datetime.min.replace(tzinfo=pytz.UTC), \
                datetime.max.replace(tzinfo=pytz.UTC)
     if date_range not in ("today", "yesterday"):
-        str_date = date_range.split(",")
-        split_date = [parse_hs_datetime_format(x, timezone) if x else None for x in str_date]
-        if len(str_date) > 1:
-            if str_date[1] in ("today", "yesterday"):
-                split_date[1] += timedelta(days=1)
-
-            # Convert to same type
-            if isinstance(split_date[0], datetime) or isinstance(split_date[1], datetime):
-                # One is a datetime. The other must be convert to datetime
-                if not split_date[0]:
-                    split_date[0] = _DATETIME_MIN_TZ
-                if not isinstance(split_date[0], datetime):
-                    split_date[0] = datetime.combine(split_date[0], datetime.min.time())
-                if not split_date[1]:
-                    split_date[1] = _DATETIME_MAX_TZ
-                if not isinstance(split_date[1], datetime):
-                    split_date[1] = datetime.combine(split_date[1], datetime.min.time())
+        if "," not in date_range:
+            # Only the start date
+            start = parse_hs_datetime_format(date_range, timezone)
+            if isinstance(start, datetime):
+                if not start.tzinfo:
+                    start = start.replace(tzinfo=timezone)
+                return start, _DATETIME_MAX_TZ
+            assert isinstance(start, date)
+            start = datetime.combine(start, _MIDNIGHT).replace(tzinfo=timezone)
+            return start, start + _ONE_DAY
+        start_str, _, end_str = date_range.partition(",")
+        start = parse_hs_datetime_format(start_str, timezone) if start_str else None
+        end = parse_hs_datetime_format(end_str, timezone) if end_str else None
+        if end_str in ("today", "yesterday"):
+            end += _ONE_DAY
+
+        if isinstance(start, datetime) or isinstance(end, datetime):
+            # One is a datetime. The other must be convert to datetime
+            if not start:
+                start = _DATETIME_MIN_TZ
+            elif not isinstance(start, datetime):
+                start = datetime.combine(start, _MIDNIGHT)
+            if not end:
+                end = _DATETIME_MAX_TZ
+            elif not isinstance(end, datetime):
+                end = datetime.combine(end, _MIDNIGHT)
 
             # Add missing tzinfo
-            if isinstance(split_date[0], datetime) and not split_date[0].tzinfo:
-                split_date[0] = split_date[0].replace(tzinfo=timezone)
-            if len(str_date) > 1 and isinstance(split_date[1], datetime) and not split_date[1].tzinfo:
-                split_date[1] = split_date[1].replace(tzinfo=timezone)
-
-            # Add missing part
-            if isinstance(split_date[0], datetime) or isinstance(split_date[1], datetime):
-                if not split_date[0]:
-                    split_date[0] = _DATETIME_MIN_TZ
-                if not split_date[1]:
-                    split_date[1] = _DATETIME_MAX_TZ
-            elif isinstance(split_date[0], date) or isinstance(split_date[1], date):
-                if not split_date[0]:
-                    split_date[0] = _DATETIME_MIN_TZ
-                if not split_date[1]:
-                    split_date[1] = _DATETIME_MAX_TZ
-                if not isinstance(split_date[0], datetime):
-                    if split_date[0] == date.min:
-                        split_date[0] = _DATETIME_MIN_TZ
-                    else:
-                        split_date[0] = datetime.combine(split_date[0],
-                                                         datetime.min.time()).replace(tzinfo=timezone)
-
-                if not isinstance(split_date[1], datetime):
-                    if split_date[1] == date.max:
-                        split_date[1] = _DATETIME_MAX_TZ
-                    else:
-                        split_date[1] = datetime.combine(split_date[1],
-                                                         datetime.max.time()).replace(tzinfo=timezone)
-            return cast(Tuple[datetime, datetime], (split_date[0], split_date[1]))
-        if isinstance(split_date[0], datetime):
-            if not split_date[0].tzinfo:
-                split_date[0] = split_date[0].replace(tzinfo=timezone)
-            return split_date[0], _DATETIME_MAX_TZ
-        assert isinstance(split_date[0], date)
-        split_date[0] = datetime.combine(split_date[0], datetime.min.time()).replace(tzinfo=timezone)
-        return split_date[0], split_date[0] + timedelta(days=1)
+            if not start.tzinfo:
+                start = start.replace(tzinfo=timezone)
+            if not end.tzinfo:
+                end = end.replace(tzinfo=timezone)
+        elif isinstance(start, date) or isinstance(end, date):
+            if not start:
+                start = _DATETIME_MIN_TZ
+            if not end:
+                end = _DATETIME_MAX_TZ
+            if not isinstance(start, datetime):
+                if start == date.min:
+                    start = _DATETIME_MIN_TZ
+                else:
+                    start = datetime.combine(start, _MIDNIGHT).replace(tzinfo=timezone)
+
+            if not isinstance(end, datetime):
+                if end == date.max:
+                    end = _DATETIME_MAX_TZ
+                else:
+                    end = datetime.combine(end, _END_OF_DAY).replace(tzinfo=timezone)
+        return cast(Tuple[datetime, datetime], (start, end))
 
     if date_range == "today":
-        today = datetime.combine(date.today(), datetime.min.time()) \
-            .replace(tzinfo=timezone)
-        return today, today + timedelta(days=1)
+        return _day_range(date.today(), timezone)
     if date_range == "yesterday":
-        yesterday = datetime.combine(date.today() - timedelta(days=1), datetime.min.time()) \
-            .replace(tzinfo=timezone)
-        return yesterday, yesterday + timedelta(days=1)
+        return _day_range(date.today() - _ONE_DAY, timezone)
     raise ValueError(f"date_range {date_range} unknown")
@@ -459,8 +459,9 @@ class Provider(DBHaystackInterface):
                 for updated_entity in diff_grid
                 if updated_entity["id"] in new_grid
             ]
-            result = haystack_db.insert_many(records)
-            log.debug("Import %s record(s)", len(result.inserted_ids))
+            if records:  # insert_many() rejects an empty list
+                result = haystack_db.insert_many(records)
+                log.debug("Import %s record(s)", len(result.inserted_ids))
 
     def import_data(self,  # pylint: disable=too-many-arguments
                     source_uri: str,
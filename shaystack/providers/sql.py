@@ -95,6 +95,36 @@ def _fix_dialect_alias(dialect: str) -> str:
     return dialect
 
 
+def _his_read_bounds(dates_range: Tuple[datetime, datetime],
+                     date_version: Optional[datetime]) -> Tuple[datetime, Tuple[datetime, datetime]]:
+    """ Return the date version and the dates range, limited to this version """
+    if not date_version:
+        date_version = datetime.max.replace(tzinfo=pytz.UTC)
+    if dates_range[1] > date_version:
+        dates_range = (dates_range[0], date_version)
+    return date_version, dates_range
+
+
+def _history_grid(entity_id: Ref,
+                  rows: List[Tuple[datetime, str]],
+                  date_version: datetime) -> Grid:
+    """ Build the `hisRead` grid of an entity, from the (ts, val) rows """
+    history = Grid(columns=["ts", "val"])
+    history.extend([{"ts": ts, "val": parse_scalar(val)} for ts, val in rows])
+    if rows:
+        min_date = min(ts for ts, _ in rows)
+        max_date = max(ts for ts, _ in rows)
+    else:
+        min_date = date_version
+        max_date = date_version
+    history.metadata = {
+        "id": entity_id,
+        "hisStart": min_date,
+        "hisEnd": max_date,
+    }
+    return history
+
+
 class _LocalConnect(local):
     """
     One connection by thread
@@ -261,43 +291,50 @@ class Provider(DBHaystackInterface):
         conn = self.get_connect()
         cursor = conn.cursor()
         customer_id = self.get_customer_id()
-        history = Grid(columns=["ts", "val"])
         field_to_datetime_tz = self._sql["field_to_datetime_tz"]
         try:
-            if not date_version:
-                date_version = datetime.max.replace(tzinfo=pytz.UTC)
-            if dates_range[1] > date_version:
-                dates_range = list(dates_range)
-                dates_range[1] = date_version
-
+            date_version, dates_range = _his_read_bounds(dates_range, date_version)
             cursor.execute(self._sql["SELECT_TS"], (customer_id, entity_id.name,
                                                     dates_range[0],
                                                     dates_range[1] + timedelta(microseconds=-1)))
-            for row in cursor:
-                history.append(
-                    {
-                        "ts": field_to_datetime_tz(row[0]),
-                        "val": parse_scalar(row[1])
-                    }
-                )
-            if history:
-                min_date = datetime.max.replace(tzinfo=pytz.UTC)
-                max_date = datetime.min.replace(tzinfo=pytz.UTC)
-
-                for time_serie in history:
-                    min_date = min(min_date, time_serie["ts"])
-                    max_date = max(max_date, time_serie["ts"])
-            else:
-                min_date = date_version
-                max_date = date_version
-
-            history.metadata = {
-                "id": entity_id,
-                "hisStart": min_date,
-                "hisEnd": max_date,
-            }
-            return history
+            return _history_grid(entity_id,
+                                 [(field_to_datetime_tz(row[0]), row[1]) for row in cursor],
+                                 date_version)
+        finally:
+            cursor.close()
 
+    @overrides
+    def his_read_many(
+            self,
+            entity_ids: List[Ref],
+            dates_range: Tuple[datetime, datetime],
+            date_version: Optional[datetime] = None,
+    ) -> List[Grid]:
+        """ Read the time series of many entities with only one request """
+        log.debug(
+            "----> Call his_read_many(ids=%s , range=%s, " "date_version=%s)",
+            repr(entity_ids),
+            repr(dates_range),
+            repr(date_version),
+        )
+        if not entity_ids:
+            return []
+        conn = self.get_connect()
+        cursor = conn.cursor()
+        customer_id = self.get_customer_id()
+        field_to_datetime_tz = self._sql["field_to_datetime_tz"]
+        try:
+            date_version, dates_range = _his_read_bounds(dates_range, date_version)
+            names = list(dict.fromkeys(entity_id.name for entity_id in entity_ids))
+            cursor.execute(self._sql["SELECT_TS_WITH_IDS"],
+                           (customer_id, self._sql["ids_to_param"](names),
+                            dates_range[0],
+                            dates_range[1] + timedelta(microseconds=-1)))
+            rows: Dict[str, List[Tuple[datetime, str]]] = {name: [] for name in names}
+            for row in cursor:
+                rows[row[0]].append((field_to_datetime_tz(row[1]), row[2]))
+            return [_history_grid(entity_id, rows[entity_id.name], date_version)
+                    for entity_id in entity_ids]
         finally:
             cursor.close()
 
@@ -511,29 +548,32 @@ class Provider(DBHaystackInterface):
                                )
                 log.debug("Update metadatas")
 
-            for row in diff_grid:  # PPR: use a batch ?
+            # Close all the entities, then insert the new versions, with one batch for each
+            closed_entities = []
+            new_entities = []
+            for row in diff_grid:
                 assert "id" in row, "Can import only entity with id"
                 sql_id = row["id"].name
-                cursor.execute(self._sql["CLOSE_ENTITY"],
-                               (
-                                   end_date,
-                                   now,
-                                   sql_id,
-                                   customer_id
-                               )
-                               )
+                closed_entities.append((
+                    end_date,
+                    now,
+                    sql_id,
+                    customer_id
+                ))
                 if "remove_" not in row:
-                    cursor.execute(self._sql["INSERT_ENTITY"],
-                                   (
-                                       sql_id,
-                                       customer_id,
-                                       now,
-                                       json.dumps(_dump_row(new_grid, new_grid[row["id"]]))
-                                   )
-                                   )
+                    new_entities.append((
+                        sql_id,
+                        customer_id,
+                        now,
+                        json.dumps(_dump_row(new_grid, new_grid[row["id"]]))
+                    ))
                     log.debug("Update record %s in DB", row['id'].name)
                 else:
                     log.debug("Remove record %s in DB", row['id'].name)
+            if closed_entities:
+                cursor.executemany(self._sql["CLOSE_ENTITY"], closed_entities)
+            if new_entities:
+                self._sql["insert_entities"](self._sql, cursor, new_entities)
 
             conn.commit()
         finally:
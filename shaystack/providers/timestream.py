@@ -12,7 +12,7 @@ Set the HAYSTACK_TS with Time-series database connection URL,
 """
 from datetime import datetime, date, time
 from os.path import dirname
-from typing import Optional, Tuple, Callable, Any, Dict
+from typing import Optional, Tuple, Callable, Any, Dict, List
 from urllib.parse import parse_qs
 from urllib.parse import urlparse
 
@@ -25,6 +25,7 @@ from overrides import overrides
 
 from .db import Provider as DBProvider
 from .db import log
+from .haystack_interface import HaystackInterface
 from .url import read_grid_from_uri
 from ..datatypes import Ref, MARKER, REMOVE, Coordinate, Quantity, NA, XStr
 from ..grid import Grid
@@ -298,6 +299,17 @@ class Provider(DBProvider):
         "xstr": "VARCHAR",
     }
 
+    @overrides
+    def his_read_many(
+            self,
+            entity_ids: List[Ref],
+            dates_range: Tuple[datetime, datetime],
+            date_version: Optional[datetime] = None,
+    ) -> List[Grid]:
+        """ Read the time series of many entities, from Timestream and not from the SQL database """
+        self._get_read_client()  # Create the client once, before the parallel threads
+        return HaystackInterface.his_read_many(self, entity_ids, dates_range, date_version)
+
     @staticmethod
     def _kind_to_timestream_type(kind: str) -> str:
         return Provider._kind_type[kind.lower()]
@@ -366,7 +366,8 @@ class Provider(DBHaystackInterface):  # pylint: disable=too-many-instance-attrib
     def values_for_tag(self, tag: str,
                        date_version: Optional[datetime] = None) -> List[Any]:
         grid = self._download_grid(self._get_url(), date_version)
-        return sorted({row[tag] for row in grid.filter(tag)})
+        values = (row.get(tag) for row in grid)
+        return sorted({value for value in values if value is not None})
 
     @overrides
     def versions(self) -> List[datetime]:
@@ -12,7 +12,7 @@ A sortable dictionary
 import collections.abc as col
 import copy
 import sys
-from typing import Callable, Any, Optional, Dict, Iterator, Union, List, Tuple
+from typing import Callable, Any, Optional, Dict, Iterator, Union, List, Tuple, Iterable
 
 import six
 
@@ -136,6 +136,25 @@ class SortableDict(col.MutableMapping):
         self._values[key] = value
         return self
 
+    def bulk_load(self, items: Iterable[Tuple[Union[str, int], Any]]) -> 'SortableDict':
+        """Add a list of items at the end, or replace the values of the existing keys.
+        Same as `add_item()` for each item, without positioning.
+
+        Args:
+            items: The list of (key, value)
+        Returns:
+            `self`
+        """
+        items = list(items)
+        if self._validate_fn:
+            for _, value in items:
+                self._validate_fn(value)
+        values = self._values
+        new_keys = [key for key in dict.fromkeys(key for key, _ in items) if key not in values]
+        values.update(items)
+        self._order.extend(new_keys)
+        return self
+
     def at(self, index: int) -> Any:  # pylint: disable=C0103
         """Return the key at the given index.
 
@@ -8,10 +8,7 @@
 """
 Tools for all parser and dumper
 """
-import re
-from typing import cast
 
-_SPECIAL_CHAR = re.compile(r'([\a\b\f\n\r\t\v\"\\\u0080-\uffff])')
 _MAP_CHAR = \
     {
         '\a': '\\a',
@@ -24,13 +21,8 @@ _MAP_CHAR = \
         '\\': '\\\\',
         '"': '\\"',
     }
-
-
-def _str_sub(match: re.Match) -> str:
-    char = cast(str, match.group(0))
-    if char in _MAP_CHAR:
-        return _MAP_CHAR.get(char, char)
-    return char
+# The unicode characters are kept as is
+_ESCAPE_TABLE = str.maketrans(_MAP_CHAR)
 
 
 def escape_str(str_value: str) -> str:
@@ -41,7 +33,7 @@ def escape_str(str_value: str) -> str:
         Returns:
             escaped string
     """
-    return _SPECIAL_CHAR.sub(_str_sub, str_value)
+    return str_value.translate(_ESCAPE_TABLE)
 
 
 def unescape_str(a_string: str, uri: bool = False) -> str:
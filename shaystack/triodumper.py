@@ -30,7 +30,8 @@ def _dump_row(grid: Grid, row: Entity) -> str:
                       c in grid.column.keys() if c in row])
 
 
-_REGULAR_STR = re.compile(r'^[^\x00-\x1F\t°\\]*$')
+_REGULAR_STR_FULLMATCH = re.compile(r'[^\x00-\x1F\t°\\]*').fullmatch
+_AMBIGUOUS_STR = frozenset(["T", "F", "NA", "R", "N", "M"])
 
 
 def _dump_str(str_value: str) -> str:
@@ -41,8 +42,8 @@ def _dump_str(str_value: str) -> str:
         if str_value.endswith("\n  "):
             str_value = str_value[:-3]
         return str_value
-    if str_value not in ["T", "F", "NA", "R", "N", "M"] \
-            and _REGULAR_STR.match(str_value):
+    if str_value not in _AMBIGUOUS_STR \
+            and _REGULAR_STR_FULLMATCH(str_value):
         return str_value
     return '"%s"' % str_value
 
@@ -61,7 +62,7 @@ def dump_grid(grid: Grid) -> str:
     return str_grid
 
 
-_INDENT = re.compile(r"^", flags=re.MULTILINE)
+_INDENT_SUB = re.compile(r"^", flags=re.MULTILINE).sub
 
 
 def dump_scalar(scalar: Any, version: Version = LATEST_VER) -> str:
@@ -76,5 +77,5 @@ def dump_scalar(scalar: Any, version: Version = LATEST_VER) -> str:
     if not isinstance(scalar, Uri) and isinstance(scalar, str):
         return _dump_str(scalar)
     if isinstance(scalar, Grid):
-        return 'Zinc:\n' + _INDENT.sub("  ", dump_zinc_grid(scalar)[:-1])
+        return 'Zinc:\n' + _INDENT_SUB("  ", dump_zinc_grid(scalar)[:-1])
     return dump_zinc_scalar(scalar, version)
@@ -15,14 +15,15 @@ import datetime
 import logging
 import re
 import sys
+from functools import lru_cache
 from threading import RLock
 from typing import Dict, Any, Callable, List, Tuple
 from typing import Optional as Typing_Optional
 
 import iso8601
 from pint import UndefinedUnitError
-from pyparsing import Regex, Forward, Combine, Suppress, CaselessLiteral, Literal, Optional, ParseException, \
-    Word, Group, Empty, delimitedList, ParserElement
+from pyparsing import Regex, Forward, Combine, Suppress, Literal, Optional, ParseException, \
+    Group, Empty, delimitedList, ParserElement
 
 from .datatypes import Quantity, Coordinate, Uri, Bin, MARKER, NA, REMOVE, Ref, XStr
 from .grid import Grid
@@ -51,14 +52,51 @@ def _reformat_exception(ex_msg: ParseException, line_num: Typing_Optional[int] =
     return msg
 
 
-def _parse_time(toks: List[str]) -> List[datetime.time]:
-    time_str = toks[0]
+def _to_time(time_str: str) -> datetime.time:
+    try:
+        return datetime.time.fromisoformat(time_str)
+    except ValueError:  # Other number of digits for the fraction
+        pass
     time_fmt = '%H:%M'
     if time_str.count(':') == 2:
         time_fmt += ':%S'
     if '.' in time_str:
         time_fmt += '.%f'
-    return [datetime.datetime.strptime(time_str, time_fmt).time()]
+    return datetime.datetime.strptime(time_str, time_fmt).time()
+
+
+def _parse_time(toks: List[str]) -> List[datetime.time]:
+    return [_to_time(toks[0])]
+
+
+def _parse_date(toks: List[str]) -> List[datetime.date]:
+    try:
+        return [datetime.date.fromisoformat(toks[0])]
+    except ValueError:
+        return [datetime.datetime.strptime(toks[0], '%Y-%m-%d').date()]
+
+
+@lru_cache(maxsize=256)
+def _fixed_offset(offset: str) -> datetime.tzinfo:
+    delta = datetime.timedelta(hours=int(offset[1:3]), minutes=int(offset[4:6]))
+    return datetime.timezone(-delta if offset[0] == '-' else delta, offset)
+
+
+def _parse_iso_datetime(toks: List[str]) -> List[datetime.datetime]:
+    # Same result as iso8601.parse_date(), without the generic parser in the common cases
+    datetime_str = toks[0].upper()
+    if datetime_str[-1] == 'Z':
+        tzinfo, end = datetime.timezone.utc, -1
+    elif datetime_str[-3] == ':' and datetime_str[-6] in '+-':
+        tzinfo, end = _fixed_offset(datetime_str[-6:]), -6
+    else:
+        tzinfo, end = datetime.timezone.utc, len(datetime_str)
+    try:
+        return [datetime.datetime.combine(datetime.date.fromisoformat(datetime_str[:10]),
+                                          _to_time(datetime_str[11:end]),
+                                          tzinfo)]
+    except ValueError:
+        return [iso8601.parse_date(datetime_str)]
 
 
 def _parse_datetime(toks: Tuple[datetime.datetime, Typing_Optional[str]]) -> List[datetime.datetime]:
@@ -108,8 +146,9 @@ def _gen_grid(toks: List[Any]) -> Grid:
     grid = Grid(version=grid_meta.pop('ver'),
                 metadata=grid_meta,
                 columns=list(col_meta.items()))
+    columns = list(grid.column.keys())  # The interned names
     for row in rows:
-        grid.append({k: row[p] for p, k in enumerate(col_meta.keys()) if row[p] is not None})
+        grid.append({k: row[p] for p, k in enumerate(columns) if row[p] is not None})
     return grid
 
 
@@ -239,9 +278,6 @@ class _GenerateMatch:
 ParserElement.setDefaultWhitespaceChars(' \t')
 # Rudimentary elements
 hs_digit = Regex(r'\d')
-hs_digits = Regex(r'[0-9_]+').setParseAction(
-    lambda toks: [''.join([t.replace('_', '') for t in toks[0]])])
-hs_alpha = Regex(r'[a-zA-Z]')
 # hs_rowSep = Regex(r' *\n *').setName('rowSep')
 hs_plusMinus = Literal('+') ^ '-'
 
@@ -261,11 +297,8 @@ hs_grid = _NearestMatch({
 })
 
 # Co-ordinates
-hs_coordDeg = Combine(
-    Optional('-') +
-    Optional(hs_digits) +
-    Optional('.' + hs_digits)
-).setParseAction(lambda toks: [float(toks[0] or '0')])
+hs_coordDeg = Regex(r'-?[0-9_]*(?:\.[0-9_]+)?').setParseAction(
+    lambda toks: [float(toks[0].replace('_', '') or '0')])
 hs_coord = (Suppress('C(') +
             hs_coordDeg +
             Suppress(',') +
@@ -274,10 +307,7 @@ hs_coord = (Suppress('C(') +
     lambda toks: [Coordinate(toks[0], toks[1])])
 
 # Dates and times
-hs_tzHHMMOffset = Combine(
-    CaselessLiteral('z') ^
-    hs_plusMinus + Regex(r'\d\d:\d\d')
-)
+hs_tzHHMMOffset = Regex(r'[zZ]|[+-]\d\d:\d\d')
 hs_tzName = Regex(r'[A-Z][a-zA-Z0-9_\-]*')
 hs_tz_UTC_GMT = Literal('UTC') ^ 'GMT'
 hs_tzUTCOffset = Combine(
@@ -286,36 +316,15 @@ hs_tzUTCOffset = Combine(
         '0'
     ))
 hs_timeZoneName = hs_tzUTCOffset ^ hs_tzName
-hs_dateSep = CaselessLiteral('T')
-hs_date_str = Combine(
-    hs_digit + hs_digit + hs_digit + hs_digit +
-    '-' +
-    hs_digit + hs_digit +
-    '-' +
-    hs_digit + hs_digit)
-hs_date = hs_date_str.copy().setParseAction(
-    lambda toks: [datetime.datetime.strptime(toks[0], '%Y-%m-%d').date()])
-
-hs_time_str = Combine(
-    hs_digit + hs_digit +
-    ':' +
-    hs_digit + hs_digit +
-    Optional(
-        ':' +
-        hs_digit + hs_digit +
-        Optional(
-            '.' +
-            hs_digit[1, ...])
-    )
-)
+hs_date_str = Regex(r'\d\d\d\d-\d\d-\d\d')
+hs_date = hs_date_str.copy().setParseAction(_parse_date)
+
+hs_time_str = Regex(r'\d\d:\d\d(?::\d\d(?:\.\d+)?)?')
 
 hs_time = hs_time_str.copy().setParseAction(_parse_time)
-hs_isoDateTime = Combine(
-    hs_date_str +
-    hs_dateSep +
-    hs_time_str +
-    Optional(hs_tzHHMMOffset)
-).setParseAction(lambda toks: [iso8601.parse_date(toks[0].upper())])
+hs_isoDateTime = Regex(
+    r'\d\d\d\d-\d\d-\d\d[Tt]\d\d:\d\d(?::\d\d(?:\.\d+)?)?(?:[zZ]|[+-]\d\d:\d\d)?'
+).setParseAction(_parse_iso_datetime)
 
 hs_dateTime = (
         hs_isoDateTime +
@@ -325,26 +334,9 @@ hs_dateTime = (
 hs_all_date = hs_dateTime | hs_date | hs_time
 
 # Quantities and raw numeric values
-hs_unitChar = hs_alpha ^ Word('%_/$' + ''.join([
-    chr(c)
-    for c in range(0x0080, 0xffff)
-]), exact=1)
-
-hs_unit = Combine(hs_unitChar[1, ...])
-hs_exp = Combine(
-    CaselessLiteral('e') +
-    Optional(hs_plusMinus) +
-    hs_digits
-)
-hs_decimal = Combine(
-    Optional('-') +
-    hs_digits +
-    Optional(
-        '.' +
-        hs_digits
-    ) +
-    Optional(hs_exp)
-).setParseAction(lambda toks: [float(toks[0])])
+hs_unit = Regex('[a-zA-Z%_/$\u0080-\ufffe]+')
+hs_decimal = Regex(r'-?[0-9_]+(?:\.[0-9_]+)?(?:[eE][+-]?[0-9_]+)?').setParseAction(
+    lambda toks: [float(toks[0].replace('_', ''))])
 
 
 def _quantity(toks):
@@ -363,39 +355,25 @@ hs_number = hs_quantity ^ hs_decimal ^ (
 ).setParseAction(lambda toks: [float(toks[0])])
 
 # URIs
-hs_uriChar = Regex(r"([^\x00-\x1f\\`]|\\[bfnrt\\:/?"
-                   + r"#\[\]@&=;`]|\\[uU][0-9a-fA-F]{4})")
-hs_uri = Combine(
-    Suppress('`') +
-    hs_uriChar[...] +
-    Suppress('`')
-).setParseAction(lambda toks: [Uri(unescape_str(toks[0], uri=True))])
+hs_uri = Regex(r"`(?:[^\x00-\x1f\\`]|\\[bfnrt\\:/?"
+               + r"#\[\]@&=;`]|\\[uU][0-9a-fA-F]{4})*`"
+               ).setParseAction(lambda toks: [Uri(unescape_str(toks[0][1:-1], uri=True))])
 
 # Strings
-hs_strChar = Regex(r"([^\x00-\x1f\\\"]|\\[bfnrt\\\"$]|\\[uU][0-9a-fA-F]{4})")
-hs_str = Combine(
-    Suppress('"') +
-    hs_strChar[...] +
-    Suppress('"')
-).setParseAction(lambda toks: [unescape_str(toks[0], uri=False)])
+hs_str = Regex(r"\"(?:[^\x00-\x1f\\\"]|\\[bfnrt\\\"$]|\\[uU][0-9a-fA-F]{4})*\""
+               ).setParseAction(lambda toks: [unescape_str(toks[0][1:-1], uri=False)])
 
 # References
-hs_refChar = hs_alpha ^ hs_digit ^ Word('_:-.~', exact=1)
 hs_ref = (
         Suppress('@') +
-        Combine(hs_refChar[...]) +
+        Regex(r'[a-zA-Z\d_:\-.~]*') +
         Optional(hs_str)
 ).setParseAction(lambda toks: [
     Ref(toks[0], toks[1] if len(toks) > 1 else None)
 ])
 
 # Bins
-hs_binChar = Regex(r"[\x20-\x27\x2a-\x7f]")
-hs_bin = Combine(
-    Suppress('Bin(') +
-    Combine(hs_binChar[...]) +
-    Suppress(')')
-).setParseAction(lambda toks: [Bin(toks[0])])
+hs_bin = Regex(r"Bin\([\x20-\x27\x2a-\x7f]*\)").setParseAction(lambda toks: [Bin(toks[0][4:-1])])
 
 # Haystack 3.0 XStr(...)
 hs_xstr = (
@@ -406,7 +384,7 @@ hs_xstr = (
 ).setParseAction(lambda toks: [XStr(toks[0], toks[1])])
 
 # Booleans
-hs_bool = Word('TF', min=1, max=1, exact=1).setParseAction(
+hs_bool = Regex('[TF]').setParseAction(
     lambda toks: [toks[0] == 'T'])
 
 # Singleton values
@@ -427,8 +405,13 @@ hs_na = Literal('NA').setParseAction(
 # We need to handle this trailing separator case.  That for now means
 # that a NULL within a list *MUST* be explicitly given using the 'N'
 # literal: we cannot support implicit NULLs as they are ambiguous.
+# The lists of plain numbers are parsed with a single regex
+_NUMBER_RE = re.compile(r'-?[0-9]+(?:\.[0-9]+)?')
+hs_number_list = Regex(
+    r'\[[ \t]*-?[0-9]+(?:\.[0-9]+)?(?:[ \t]*,[ \t]*-?[0-9]+(?:\.[0-9]+)?)*[ \t]*,?[ \t]*\]'
+).setParseAction(lambda toks: [[float(number) for number in _NUMBER_RE.findall(toks[0])]])
 hs_list = _GenerateMatch(
-    lambda ver: Group(
+    lambda ver: hs_number_list | Group(
         Suppress('[') +
         Optional(delimitedList(
             hs_scalar[ver],
@@ -10,6 +10,7 @@
 A support of Haystack timezone
 """
 import datetime
+from functools import lru_cache
 from typing import Any
 
 import pytz
@@ -462,6 +463,7 @@ def _get_tz_rmap():
     return tz_rmap
 
 
+@lru_cache(maxsize=64)
 def timezone(haystack_tz: str) -> Any:
     """Retrieve the Haystack timezone
 
@@ -10,11 +10,12 @@
 from __future__ import unicode_literals
 
 import binascii
+import pickle
 import random
 from copy import copy, deepcopy
 from typing import Dict, Any
 
-from nose.tools import eq_
+import pytest
 
 import shaystack
 from shaystack.datatypes import XStr, Uri, Bin, MARKER, NA, REMOVE, Quantity
@@ -129,45 +130,36 @@ def test_ref_hash():
            hash('a.ref')
 
 
+def test_ref_copy():
+    ref = shaystack.Ref(name='a.ref', value='display text')
+    for a_copy in (copy(ref), deepcopy(ref), pickle.loads(pickle.dumps(ref))):
+        assert a_copy == ref
+        assert a_copy.value == ref.value
+        assert hash(a_copy) == hash('a.ref')
+
+
 def test_ref_std_method():
     assert str(shaystack.Ref(name='a.ref', value='display text')) == '@a.ref \'display text\''
 
 
-def test_qty_unary_ops():
-    # How to run the test: check the result
-    # applied to the Quantity object matches what
-    # would be returned for the same operation applied
-    # to the raw value.
-    def _check_qty_op(_fn, *vals):
-        for val in vals:
-            quantity = shaystack.Quantity(val)
-            assert _fn(quantity) == a_lambda(quantity.m)
-
-    # Try this both without, and with, pint enabled
-    # These work for floats
-    for a_lambda in (
-            int,
-            complex,
-            float,
-            lambda v: -v,
-            lambda v: +v,
-            abs):
-        yield _check_qty_op, a_lambda, 123.45, -123.45
-
-    # These work for integers
-    for a_lambda in (
-            lambda v: oct(int(v)),
-            lambda v: hex(int(v)),
-            lambda v: v.__index__(),
-            int,
-            complex,
-            float,
-            lambda v: -v,
-            lambda v: +v,
-            abs,
-            lambda v: ~int(v),
-    ):
-        yield _check_qty_op, a_lambda, 123, -123
+# Check the result applied to the Quantity object matches what
+# would be returned for the same operation applied to the raw value.
+_FLOAT_OPS = [int, complex, float, lambda v: -v, lambda v: +v, abs]
+_INT_OPS = _FLOAT_OPS + [
+    lambda v: oct(int(v)),
+    lambda v: hex(int(v)),
+    lambda v: v.__index__(),
+    lambda v: ~int(v),
+]
+
+
+@pytest.mark.parametrize("a_lambda, vals",
+                         [(a_lambda, (123.45, -123.45)) for a_lambda in _FLOAT_OPS] +
+                         [(a_lambda, (123, -123)) for a_lambda in _INT_OPS])
+def test_qty_unary_ops(a_lambda, vals):
+    for val in vals:
+        quantity = shaystack.Quantity(val)
+        assert a_lambda(quantity) == a_lambda(quantity.m)
 
 
 def test_qty_hash():
@@ -270,8 +262,8 @@ def test_coord_default_method():
     coord = shaystack.Coordinate(latitude=33.77, longitude=-77.45)
     ref_str = '33.770000° lat -77.450000° long'
 
-    eq_(repr(coord), 'Coordinate(33.77, -77.45)')
-    eq_(str(coord), ref_str)
+    assert repr(coord) == 'Coordinate(33.77, -77.45)'
+    assert str(coord) == ref_str
 
 
 def test_xstr_hex():
@@ -7,12 +7,13 @@ import logging
 import os
 import textwrap
 from typing import cast
+from unittest.mock import MagicMock
 
 import pytz
 
 from shaystack.providers import get_provider
 # noinspection PyProtectedMember
-from shaystack.providers.db_postgres import _sql_filter as sql_filter
+from shaystack.providers.db_postgres import _sql_filter as sql_filter, _insert_entities, get_db_parameters
 from shaystack.providers.sql import Provider as SQLProvider
 
 logging.basicConfig(level=os.environ.get("LOG_LEVEL", "WARNING"))
@@ -982,3 +983,12 @@ def test_select_with_id():
         AND t1.entity->>'id' LIKE 'r:p:demo:r:23a44701-3a62fd7a%'
         LIMIT 1
         """)
+
+
+def test_insert_entities_with_another_driver():
+    # Only a psycopg2 cursor accepts the multi-rows INSERT
+    params = get_db_parameters("haystack")
+    cursor = MagicMock()
+    entities = [("id1", "", FAKE_NOW, "{}"), ("id2", "", FAKE_NOW, "{}")]
+    _insert_entities(params, cursor, entities)
+    cursor.executemany.assert_called_once_with(params["INSERT_ENTITY"], entities)
@@ -6,6 +6,7 @@
 #
 # vim: set ts=4 sts=4 et tw=78 sw=4 si:
 import datetime
+import io
 import json
 import textwrap
 from csv import reader
@@ -15,6 +16,7 @@ import pytz
 
 import shaystack
 from shaystack import dump_scalar, MODE_TRIO, MODE_ZINC, MODE_CSV, Entity
+from shaystack import jsondumper, csvdumper
 from .test_parser import SIMPLE_EXAMPLE_ZINC, SIMPLE_EXAMPLE_JSON, \
     METADATA_EXAMPLE_JSON, SIMPLE_EXAMPLE_CSV, METADATA_EXAMPLE_CSV, SIMPLE_EXAMPLE_TRIO
 
@@ -149,6 +151,14 @@ def test_simple_json():
     assert grid_json == SIMPLE_EXAMPLE_JSON
 
 
+
+def test_json_text():
+    # The JSON text is the one of the `json` module: with spaces, and ASCII only
+    grid = shaystack.Grid(columns=["s"])
+    grid.append({"s": "\u00e9"})
+    assert shaystack.dump(grid, mode=shaystack.MODE_JSON) == \
+           '{"meta": {"ver": "3.0"}, "cols": [{"name": "s"}], "rows": [{"s": "s:\\u00e9"}]}'
+
 def test_simple_csv():
     grid = make_simple_grid()
     grid_csv = shaystack.dump(grid, mode=shaystack.MODE_CSV)
@@ -872,6 +882,16 @@ def test_scalar_ref_json():
                                  mode=shaystack.MODE_JSON) == '"r:areference a display name"'
 
 
+def test_scalar_to_jsonable():
+    # Must be the same as the JSON string, without the serialization
+    for value in [None, shaystack.MARKER, True, 1.5,
+                  shaystack.Ref('areference', 'a display name'),
+                  [1, "a", shaystack.Quantity(2, "m")],
+                  {"a": shaystack.MARKER, "b": [datetime.date(2021, 1, 2)]}]:
+        assert jsondumper.dump_scalar_to_jsonable(value) == \
+               json.loads(shaystack.dump_scalar(value, mode=shaystack.MODE_JSON))
+
+
 def test_scalar_ref_csv():
     # No need to be exhaustive, the underlying function is tested heavily by
     # the grid dump tests.
@@ -1070,6 +1090,76 @@ comment
 '''[1:]
 
 
+def test_mixed_types_csv():
+    # The type of the first value of a column must not be applied to the others
+    grid = shaystack.Grid(version=shaystack.VER_3_0, columns=['id', 'val'])
+    grid.extend(cast(List[Entity], [
+        {'id': shaystack.Ref('a'), 'val': 'text'},
+        {'id': shaystack.Ref('b')},
+        {'id': shaystack.Ref('c'), 'val': 1.5},
+        {'id': shaystack.Ref('d'), 'val': True},
+        {'id': shaystack.Ref('e'), 'val': shaystack.MARKER},
+    ]))
+    grid_csv = shaystack.dump(grid, mode=shaystack.MODE_CSV)
+    assert grid_csv == 'id,val\n@a,"text"\n@b,\n@c,1.5\n@d,true\n@e,\u2713\n'
+
+
+def test_sparse_column_csv():
+    # More rows than a batch, with a column of one type and some missing values
+    grid = shaystack.Grid(version=shaystack.VER_3_0, columns=['id', 'val'])
+    grid.extend(cast(List[Entity], [{'id': shaystack.Ref('r%d' % i), 'val': float(i)} if i % 3 else
+                                    {'id': shaystack.Ref('r%d' % i)} for i in range(2000)]))
+    lines = shaystack.dump(grid, mode=shaystack.MODE_CSV).split('\n')
+    assert len(lines) == 2002
+    assert lines[1] == '@r0,'
+    assert lines[1999] == '@r1998,'
+    assert lines[2000] == '@r1999,1999.0'
+
+
+def test_dump_int_csv():
+    assert [dump_scalar(i, MODE_CSV) for i in (-17, -16, 0, 255, 256)] == ['-17', '-16', '0', '255', '256']
+    assert dump_scalar(1.0, MODE_CSV) == '1.0'
+
+
+def test_dump_grids_csv():
+    grids = []
+    for i in range(3):
+        grid = shaystack.Grid(version=shaystack.VER_3_0, columns=['id', 'val', 'flag'])
+        grid.append({'id': shaystack.Ref('r%d' % i), 'val': shaystack.Quantity(i, '°F'), 'flag': shaystack.MARKER})
+        grids.append(grid)
+    expected = [shaystack.dump(grid, mode=shaystack.MODE_CSV) for grid in grids]
+    assert csvdumper.dump_grids(grids, max_workers=2) == expected
+    assert csvdumper.dump_grids(grids, max_workers=1) == expected
+
+
+def test_dump_grid_to_stream():
+    grid = shaystack.Grid(version=shaystack.VER_3_0, columns=['id', 'val'])
+    grid.extend(cast(List[Entity], [
+        {'id': shaystack.Ref('a'), 'val': 'text'},
+        {'id': shaystack.Ref('b')},
+    ]))
+    stream = io.StringIO()
+    csvdumper.dump_grid_to(stream, grid)
+    assert stream.getvalue() == shaystack.dump(grid, mode=shaystack.MODE_CSV)
+
+
+def test_dump_unambiguous_str_csv():
+    assert dump_scalar("hello, world", MODE_CSV) == '"hello, world"'
+    assert dump_scalar('say "hi"', MODE_CSV) == '"say ""hi"""'
+    assert dump_scalar("_12", MODE_CSV) == '"""_12"""'
+    assert dump_scalar('foo("x")', MODE_CSV) == '"""foo(""x"")"""'
+
+
+def test_dump_cached_values_csv():
+    # Same instant or same ref name, but not the same representation
+    utc = datetime.datetime(2020, 1, 1, 10, 0, tzinfo=pytz.utc)
+    paris = utc.astimezone(pytz.timezone('Europe/Paris'))
+    assert dump_scalar(utc, MODE_CSV) == '2020-01-01T10:00:00+00:00'
+    assert dump_scalar(paris, MODE_CSV) == '2020-01-01T11:00:00+01:00'
+    assert dump_scalar(shaystack.Ref('a', 'one'), MODE_CSV) == '@a one'
+    assert dump_scalar(shaystack.Ref('a', 'two'), MODE_CSV) == '@a two'
+
+
 def test_dump_invalide_scalar():
     assert dump_scalar(None)
 
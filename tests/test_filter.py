@@ -1,17 +1,20 @@
 # (C) 2020 Philippe PRADOS
 # -*- coding: utf-8 -*-
 # vim: set ts=4 sts=4 et tw=78 sw=4 si:
-import gc
+import sys
 from datetime import time, date, datetime
 from typing import cast
 
 from iso8601 import iso8601
+from pyparsing import ParseException
 
-from shaystack import Grid, Uri, Ref, Coordinate, MARKER, XStr, grid_filter
+from shaystack import Grid, Uri, Ref, Coordinate, MARKER, XStr, Quantity, grid_filter, parse_filter
 from shaystack.empty_grid import EmptyGrid
 from shaystack.filter_ast import FilterUnary, FilterBinary, FilterPath, FilterAST
 # noinspection PyProtectedMember
-from shaystack.grid_filter import hs_filter, _FnWrapper, filter_function
+from shaystack.grid_filter import hs_filter, filter_function, \
+    _fast_iso_datetime, _fast_iso_date, _fast_iso_time
+from shaystack.zincparser import hs_all_date
 from shaystack.zoneinfo import timezone
 
 
@@ -169,6 +172,52 @@ def test_filter_boolean_operator():
     assert cast(FilterPath, result.right.left).paths == ["siteRef", "geoCity"]
 
 
+def test_parse_filter_same_as_grammar():
+    for a_filter in ['geo',
+                     'a == 1 and b',
+                     '(a or b) and not c->d',
+                     'a and b and c or d or e',
+                     'a->b->c <= 2021-01-01',
+                     'a == -1.5e3 or b == 5',
+                     'a == @x "y" and b == @z',
+                     'a == "x\\"y" and b == `http://x`',
+                     'a == 1977-04-22T01:00:00-05:00 New_York',
+                     'a == [1,2] or b == NA or c == T',
+                     ' ( a or b ) and c != true ']:
+        assert repr(parse_filter(a_filter).head) == \
+               repr(hs_filter.parseString(a_filter, parseAll=True)[0])
+    # The quantities are not accepted by the grammar with all the versions of pyparsing
+    result = parse_filter('a == -1.5e3 or b == 5kW').head
+    assert cast(FilterBinary, result.right).right == Quantity(5, "kW")
+
+
+def test_parse_filter_keywords():
+    assert parse_filter('notes').head.operator == "has"
+    assert parse_filter('android or order').head.operator == "or"
+    for a_filter in ['a ==', 'a or', 'a == @x)', '(a', 'a andb', 'a == 1, b', 'a ==\n1', 'a\nand b']:
+        try:
+            parse_filter(a_filter)
+            assert False, a_filter
+        except ParseException:
+            pass
+
+
+def test_parse_filter_value_error():
+    # The errors of the values are reported like the other errors, with the position in the filter
+    for a_filter, loc in [('a == 0x10', 5), ('b and a == "x', 11)]:
+        try:
+            parse_filter(a_filter)
+            assert False, a_filter
+        except ParseException as ex:
+            assert ex.loc == loc, a_filter
+
+
+def test_parse_filter_interned_paths():
+    paths = parse_filter('siteRef->geoCity').head.right.paths
+    assert paths == ['siteRef', 'geoCity']
+    assert paths[1] is sys.intern('geoCity')
+
+
 def test_generated_filter():
     assert filter_function('equip == "Chicago"')(EmptyGrid, {"equip": "Chicago"})
     assert filter_function('equip == "Chicago" or not acme')(EmptyGrid, {"equip": "Chicago"})
@@ -182,6 +231,18 @@ def test_generated_filter_with_reference():
     assert filter_function('ref == @id1')(EmptyGrid, {"ref": Ref("id1")})
 
 
+def test_generated_filter_with_falsy_values():
+    assert filter_function('a == 0')(EmptyGrid, {"a": 0.0})
+    assert filter_function('a == false')(EmptyGrid, {"a": False})
+    assert filter_function('a == ""')(EmptyGrid, {"a": ""})
+    assert filter_function('a')(EmptyGrid, {"a": False})
+    assert filter_function('not a')(EmptyGrid, {"a": None})
+    assert filter_function('not a->b')(Grid(), {"a": Ref("unknown")})
+    assert filter_function('not a->b')(EmptyGrid, {"a": "str"})
+    assert filter_function('a != 5')(EmptyGrid, {}) is False
+    assert filter_function('a->b < 5')(EmptyGrid, {"a": "str"}) is False
+
+
 def test_grid_filter():
     grid = Grid(columns={'id': {}, 'site': {}, 'equip': {}, 'geoPostalCode': {}, 'ahu': {},
                          'geoCity': {}, 'curVal': {}, 'hvac': {}, 'siteRef': {}})
@@ -265,20 +326,31 @@ def test_grid_specification_filter_sample():
 
 
 # noinspection PyUnresolvedReferences
-def test_if_generated_function_removed():
-    # Check if the generated function will be removed
-    wrapper = _FnWrapper("_acme", "def _acme(): pass")
-    # pylint: disable=no-member
-    assert grid_filter._acme  # type: ignore
-    # pylint: enable=no-member
-    if wrapper:
-        del wrapper
-    gc.collect()
-    try:
-        assert grid_filter._acme is not None  # type: ignore
-        assert False
-    except AttributeError:
-        pass
+def test_filter_function_cached():
+    function = filter_function('site and geoCity == "Chicago"')
+    assert function is filter_function('site and geoCity == "Chicago"')
+    assert function(EmptyGrid, {"site": MARKER, "geoCity": "Chicago"})
+    assert not function(EmptyGrid, {"site": MARKER, "geoCity": "Paris"})
+
+
+def test_generated_filter_with_literal_objects():
+    # The values are captured as objects, whatever their repr()
+    entity = {"q": Quantity(5, "kW"), "c": Coordinate(1.5, 2.5), "r": Ref("x", "dis"),
+              "d": timezone("Paris").localize(datetime(2021, 1, 1, 12, 30))}
+    assert filter_function('q == 5kW and c == C(1.5,2.5) and r == @x')(EmptyGrid, entity)
+    assert filter_function('d == 2021-01-01T12:30:00+01:00 Paris')(EmptyGrid, entity)
+
+
+def test_generated_filter_short_circuit():
+    # The right operand would raise a TypeError ("str" < 5.0)
+    assert not filter_function('a and b < 5')(EmptyGrid, {"b": "str"})
+    assert filter_function('a or b < 5')(EmptyGrid, {"a": MARKER, "b": "str"})
+
+
+def test_filter_to_python():
+    _, python_code = grid_filter._filter_to_python('site or not point')
+    assert python_code.endswith("return ((_get_path(_grid, _entity, ['site']) is not NOT_FOUND) or "
+                                "(_get_path(_grid, _entity, ['point']) is NOT_FOUND))")
 
 
 def test_slide_get():
@@ -341,3 +413,32 @@ def test_xstr():
     grid.append({'id': Ref('id1'), 'data': XStr("hex", 'deadbeef')})
 
     assert len(grid.filter('data == hex("deadbeef")')) == 1
+
+
+def test_fast_iso_format():
+    # The fast positional parsers must be the same as the haystack grammar
+    for datetime_str in ['2020-01-02T10:00:00Z', '2020-01-02t10:00', '2020-01-02T10:00:00.5+01:00',
+                         '2020-01-02T10:00:00.1234567-05:30', '2020-01-02T10:00:00+00:00']:
+        fast = _fast_iso_datetime(datetime_str)
+        expected = hs_all_date.parseString(datetime_str, parseAll=True)[0]
+        assert fast == expected
+        assert fast.tzname() == expected.tzname()
+    assert _fast_iso_date('2020-01-02') == date(2020, 1, 2)
+    assert _fast_iso_time('10:00:01.5') == time(10, 0, 1, 500000)
+    for invalid in ['2020-01-02T10:00:00 UTC', '2020-01-02T25:00:00Z', '2020-01-02T10:00:00+0100',
+                    '10:00:01.', '1_:00', '2020-02-30']:
+        assert _fast_iso_datetime(invalid) is None
+        assert _fast_iso_time(invalid) is None
+        assert _fast_iso_date(invalid) is None
+    assert grid_filter.parse_hs_datetime_format('2020-01-02T10:00:00 UTC', timezone('UTC')) == \
+           datetime(2020, 1, 2, 10, tzinfo=timezone('UTC'))
+
+
+def test_parse_hs_format_cached():
+    value = grid_filter.parse_hs_datetime_format('2020-01-02T10:00:00 UTC', timezone('UTC'))
+    assert grid_filter.parse_hs_datetime_format('2020-01-02T10:00:00 UTC', timezone('Paris')) is value
+    assert grid_filter.parse_hs_date_format('2020-01-02') is grid_filter.parse_hs_date_format('2020-01-02')
+    assert grid_filter.parse_hs_time_format('10:00') is grid_filter.parse_hs_time_format('10:00')
+    # The relative dates are not cached
+    assert grid_filter.parse_hs_datetime_format('today', timezone('UTC')).date() == date.today()
+    assert grid_filter.parse_hs_datetime_format('today', timezone('Paris')).tzinfo is timezone('Paris')
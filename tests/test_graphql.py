@@ -1,15 +1,20 @@
-from datetime import datetime
+from datetime import datetime, date, time, timezone as dt_timezone
 from typing import cast
 from unittest.mock import patch
 
 import pytz
 from graphene.test import Client
+from graphql.language.ast import StringValue
 from pytz import timezone
 
+import shaystack
 from app.blueprint_graphql import schema
+from app.graphql_model import HSDateTime, HSDate, HSTime, HSUri, HSScalar, _parse_hs_datetime, \
+    _id_to_ref
 from shaystack import Grid, VER_3_0, Uri, Ref, Coordinate, MARKER
 from shaystack.providers import get_provider
 from shaystack.providers.url import Provider as URLProvider
+from shaystack.zincdumper import _dump_hs_date_time
 from tests import _get_mock_s3
 
 
@@ -562,3 +567,52 @@ def test_his_read_with_coordinate(mock_s3, mock_get_url):
                          {'histories':
                               [[{'ts': '2020-01-01T00:00:00+00:00 UTC', 'val': 'c:100.000000,150.000000',
                                  'coord': {'latitude': 100.0, 'longitude': 150.0}}]]}}}
+
+
+def test_parse_hs_scalars():
+    assert HSDateTime.parse_value("2020-01-01T10:00:00Z") == datetime(2020, 1, 1, 10, tzinfo=pytz.utc)
+    assert HSDateTime.parse_value("t:2020-01-01T10:00:00+00:00") == datetime(2020, 1, 1, 10, tzinfo=pytz.utc)
+    assert HSDateTime.parse_value("2020-01-01T10:00:00+01:00 Paris") == \
+           datetime(2020, 1, 1, 9, tzinfo=pytz.utc)
+    assert HSDate.parse_value("2020-01-01") == date(2020, 1, 1)
+    assert HSTime.parse_value("10:00:01") == time(10, 0, 1)
+    assert HSUri.parse_value("u:http://localhost") == Uri("http://localhost")
+
+    # The same string is parsed only once
+    HSDateTime.parse_value("2020-01-02T10:00:00Z")
+    hits = _parse_hs_datetime.cache_info().hits
+    HSDateTime.parse_value("2020-01-02T10:00:00Z")
+    assert _parse_hs_datetime.cache_info().hits == hits + 1
+
+    # Relative dates are never cached
+    _parse_hs_datetime.cache_clear()
+    HSDateTime.parse_value("today")
+    assert _parse_hs_datetime.cache_info().currsize == 0
+
+
+def test_serialize_hs_scalars():
+    # The UTC fast path must be the same as the haystack dump
+    for tz in [pytz.UTC, timezone("Europe/Paris")]:
+        date_time = tz.localize(datetime(2020, 1, 2, 10, 0, 0, 123))
+        assert HSDateTime.serialize(date_time) == _dump_hs_date_time(date_time)
+    assert HSDateTime.serialize(datetime(2020, 1, 2, 10, 0, 0, tzinfo=dt_timezone.utc)) == \
+           "2020-01-02T10:00:00+00:00 UTC"
+    assert HSDate.serialize(date(2020, 1, 2)) == "2020-01-02"
+    assert HSTime.serialize(time(10, 0, 0)) == "10:00:00"
+
+
+def test_id_to_ref():
+    assert _id_to_ref("r:id1") == Ref("id1")
+    assert _id_to_ref("@id1") == Ref("id1")
+    assert _id_to_ref("id1") == Ref("id1")
+    assert _id_to_ref("id1") is _id_to_ref("id1")
+
+
+def test_parse_literal_hs_scalar():
+    # The direct paths must be the same as the haystack json parser
+    for value in ["s:hello", "s:", "r:id1", "r:id1 a display name", "r:id1 ", "r:id:1 dis",
+                  "s:with\\nescape", "r:bad/name", "n:12 m", "u:http://localhost", "m:"]:
+        assert HSScalar.parse_literal(StringValue(value=value)) == \
+               shaystack.parse_scalar(value, shaystack.MODE_JSON), value
+    assert HSScalar.parse_literal(StringValue(value="r:id1 dis")).value == "dis"
+    assert HSScalar.parse_literal(StringValue(value="hello")) == "hello"
@@ -10,7 +10,7 @@ from __future__ import unicode_literals
 import copy
 import datetime
 
-from shaystack import mode_to_suffix, suffix_to_mode, Ref
+from shaystack import mode_to_suffix, suffix_to_mode, Ref, MARKER
 from shaystack.grid import Grid, Version, VER_3_0, Quantity, Coordinate
 from shaystack.sortabledict import SortableDict
 
@@ -208,6 +208,20 @@ def test_pop_multiple_pos():
     assert id(old) == id(row)
 
 
+def test_pop_mixed_pos():
+    grid = Grid(columns=["id", "a"])
+    rows = [{"id": Ref("id%d" % i), "a": i} for i in range(10)]
+    grid.extend(rows)
+    old = grid.pop(7, 2, 5, 20)
+    assert old is rows[2]
+    assert [row["a"] for row in grid] == [0, 1, 3, 4, 6, 8, 9]
+    assert Ref("id2") not in grid
+    assert grid[Ref("id3")] is rows[3]
+    old = grid.pop(Ref("id9"), Ref("id0"))
+    assert old is rows[0]
+    assert [row["a"] for row in grid] == [1, 3, 4, 6, 8]
+
+
 def test_pop_invalid_pos():
     grid = Grid(columns=["id", "a"])
     row = {"id": Ref("myid"), "a": 1, "b": 2}
@@ -250,6 +264,28 @@ def test_grid_extend():
     assert Ref('id2') in grid._index
 
 
+def test_grid_setitem_ref_with_equal_rows():
+    grid = Grid(columns=["id", "a"])
+    rows = [{"a": 1}, {"id": Ref("id1"), "a": 1}, {"id": Ref("id2"), "a": 2}]
+    grid.extend(rows)
+    grid[Ref("id2")] = {"id": Ref("id2"), "a": 3}
+    grid[Ref("id2")] = {"id": Ref("id2"), "a": 4}
+    grid.insert(0, {"a": 0})
+    grid[Ref("id1")] = {"id": Ref("id1"), "a": 5}
+    assert [row["a"] for row in grid] == [0, 1, 5, 4]
+
+
+def test_grid_setitem_pos_after_extend():
+    grid = Grid(columns=["id", "a"])
+    grid.extend([{"id": Ref("id1"), "a": 1}, {"id": Ref("id2"), "a": 2}])
+    grid[0] = {"id": Ref("id3"), "a": 3}
+    assert Ref("id1") not in grid
+    assert grid[Ref("id3")]["a"] == 3
+    grid[1] = {"id": Ref("id4"), "a": 4}
+    assert Ref("id2") not in grid
+    assert grid[Ref("id4")]["a"] == 4
+
+
 def test_grid_copy():
     grid = Grid(columns=['test'])
     rows = [
@@ -265,6 +301,19 @@ def test_grid_copy():
     assert len(grid_2) == 3
 
 
+def test_grid_copy_mutable_values():
+    grid = Grid(columns={'test': {'unit': 'kg'}})
+    grid.metadata['meta'] = 'value'
+    grid.append({'test': Quantity(1, 'kg'), 'list': [1, 2], 'id': Ref('id1')})
+    grid_2 = grid.copy()
+    assert grid_2 == grid
+    assert grid_2[0] is not grid[0]
+    assert grid_2[0]['list'] is not grid[0]['list']
+    grid_2.metadata['other'] = [1]  # Validated by the copy
+    assert 'other' not in grid.metadata
+    assert grid_2[Ref('id1')] is grid_2[0]
+
+
 def test_grid_str():
     grid = Grid(version=VER_3_0)
     rows = [
@@ -286,6 +335,33 @@ def test_grid_str():
            '\ttest=3\n'
 
 
+def test_grid_str_large():
+    grid = Grid(version=VER_3_0, columns=['test', 'other'])
+    grid.extend([{'test': i} for i in range(100)])
+    lines = repr(grid).split('\n')
+    assert '\t---- Row    9:' in lines
+    assert '\t... 80 rows omitted ...' in lines
+    assert '\t---- Row   10:' not in lines
+    assert '\t---- Row   90:' in lines
+    assert '\tother absent' in lines
+    assert lines[-2] == '\tother absent'
+
+
+def test_grid_sort():
+    grid = Grid(columns=['id', 'v'])
+    grid.extend([{'id': Ref('a'), 'v': 3}, {'id': Ref('b'), 'v': 1}, {'id': Ref('c'), 'v': 2}])
+    assert [row['v'] for row in grid.sort('v')] == [1, 2, 3]
+    assert grid[0] is grid[Ref('b')]
+
+    grid = Grid(columns=['v'])
+    grid.extend([{'v': Quantity(3, 'kW')}, {'v': Quantity(1, 'kW')}, {'v': Quantity(2, 'kW')}])
+    assert [row['v'].m for row in grid.sort('v')] == [1, 2, 3]
+
+    grid = Grid(columns=['v'])
+    grid.extend([{'v': Quantity(3, 'kW')}, {'v': Quantity(2, 'W')}, {'v': Quantity(1, 'kW')}])
+    assert [row['v'].m for row in grid.sort('v')] == [2, 1, 3]
+
+
 def test_grid_equal():
     ref = Grid()
     ref.column['test'] = {}
@@ -328,6 +404,20 @@ def test_grid_equal_with_other_order():
     assert left == copy.deepcopy(right)
 
 
+def test_grid_equal_with_other_order_without_id():
+    left = Grid()
+    left.column['dis'] = {}
+    left.column['val'] = {}
+    left.extend([{'dis': 'row %d' % (i % 10), 'val': float(i)} for i in range(500)])
+    right = Grid()
+    right.column['dis'] = {}
+    right.column['val'] = {}
+    right.extend([{'dis': 'row %d' % (i % 10), 'val': i + 0.0000001, 'other': None} for i in reversed(range(500))])
+    assert left == right
+    right[0]['dis'] = 'changed'
+    assert left != right
+
+
 def test_grid_equal_with_complex_datas():
     ref = Grid()
     ref.column['test'] = {}
@@ -576,6 +666,15 @@ def test_pack_columns_with_unused_columns():
     assert set(grid.column.keys()) == {"id", "a"}
 
 
+def test_pack_columns_keep_order():
+    grid = Grid(columns=["c", "b", "id", "a"])
+    grid.append({"id": Ref("myid"), "a": 1})
+    grid.append({"id": Ref("myid2"), "c": 1})
+    grid.pack_columns()
+    assert isinstance(grid.column, SortableDict)
+    assert list(grid.column.keys()) == ["c", "id", "a"]
+
+
 def test_pack_columns_with_all_columns():
     grid = Grid(columns=["id", "a", "b"])
     grid.append({"id": Ref("myid"), "a": 1, "b": 2})
@@ -590,6 +689,50 @@ def test_extends_columns():
     assert "b" in grid.column
 
 
+def test_extends_columns_of_filtered_grid():
+    grid = Grid(columns=["id", "a"])
+    grid.append({"id": Ref("myid"), "a": 1})
+    filtered_grid = grid.filter("a")
+    filtered_grid.append({"id": Ref("otherid"), "c": 3, "b": 2})
+    filtered_grid.extends_columns()
+    assert list(filtered_grid.column.keys()) == ["id", "a", "c", "b"]
+    assert list(grid.column.keys()) == ["id", "a"]
+
+
+def test_pack_columns_of_filtered_grid():
+    grid = Grid(columns=["id", "site", "a"])
+    grid.append({"id": Ref("myid"), "site": MARKER})
+    grid.append({"id": Ref("otherid"), "a": 1})
+    filtered_grid = grid.filter("site")
+    filtered_grid.pack_columns()
+    assert list(filtered_grid.column.keys()) == ["id", "site"]
+    assert list(grid.column.keys()) == ["id", "site", "a"]
+
+
+def test_change_schema_of_slice_and_filtered_grid():
+    grid = Grid(metadata={"dis": "grid"}, columns={"id": {}, "a": {"unit": "kW"}})
+    grid.append({"id": Ref("myid"), "a": 1})
+    for new_grid in (grid[:], grid.filter("a")):
+        new_grid.metadata["x"] = "y"
+        new_grid.column["b"] = {}
+        new_grid.column["a"]["dis"] = "A"
+        assert "x" in new_grid.metadata
+        assert list(new_grid.column.keys()) == ["id", "a", "b"]
+    assert list(grid.metadata.keys()) == ["dis"]
+    assert list(grid.column.keys()) == ["id", "a"]
+    assert list(grid.column["a"].keys()) == ["unit"]
+
+
+def test_grid_with_shared_nan_not_equal():
+    # NaN is never equal to itself, even if the value is shared by two grids
+    grid = Grid(columns=["id", "a", "b"])
+    grid.append({"id": Ref("myid"), "a": float("nan"), "b": 1})
+    assert grid != grid[:]
+    grid = Grid(columns=["id", "a", "b"])
+    grid.append({"id": Ref("myid"), "a": Quantity(float("nan"), "kW"), "b": 1})
+    assert grid != grid[:]
+
+
 def test_mode_to_suffix():
     assert mode_to_suffix(suffix_to_mode(".csv")) == ".csv"
     assert mode_to_suffix(suffix_to_mode(".zinc")) == ".zinc"
@@ -255,3 +255,25 @@ def test_his_read_with_range_one_date(mock) -> None:
     assert response.status_code == 200
     assert response.headers["Content-Type"].startswith(mime_type)
     assert shaystack.parse(response.body, mime_type) is not None
+
+
+@patch.object(ping.Provider, 'his_read')
+def test_his_read_many(mock) -> None:
+    # GIVEN
+    """
+    Args:
+        mock:
+    """
+    envs = {'HAYSTACK_PROVIDER': 'shaystack.providers.ping'}
+    mock.side_effect = lambda entity_id, dates_range, date_version: entity_id
+    provider = ping.Provider(envs)
+    ids = [Ref(f"id{i}") for i in range(20)]
+    dates_range = (datetime.min.replace(tzinfo=pytz.UTC),
+                   datetime.max.replace(tzinfo=pytz.UTC))
+
+    # WHEN
+    grids = provider.his_read_many(ids, dates_range, None)
+
+    # THEN
+    assert grids == ids
+    assert mock.call_count == len(ids)
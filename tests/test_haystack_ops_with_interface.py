@@ -1,3 +1,4 @@
+from shaystack import MARKER
 from shaystack.providers import get_provider
 
 
@@ -74,3 +75,46 @@ def test_ops_with_nav():
     # THEN
     assert len(ops) == 3
     assert ops[2]['name'] == 'nav'
+
+
+def test_ops_cached():
+    # GIVEN
+    provider = get_provider('tests.tstprovider_readonly', {})
+
+    # WHEN
+    ops = provider.ops()
+    ops.pop(0)
+    ops[0]['name'] = 'updated'
+    ops.metadata['updated'] = MARKER
+
+    # THEN
+    assert provider.ops() is not ops
+    assert 'updated' not in provider.ops().metadata
+    assert [row['name'] for row in provider.ops()] == ['ops', 'formats', 'read', 'hisRead']
+
+
+def test_provider_implements_only_abstract_methods():
+    # GIVEN
+    provider = get_provider('tests.tstprovider_readonly', {}, use_cache=False)
+
+    # THEN
+    provider_class = type(provider).__base__
+    assert 'read' not in vars(type(provider))
+    assert type(provider).read is provider_class.read
+    try:
+        provider.nav("id")
+        assert False
+    except NotImplementedError:
+        pass
+
+
+def test_provider_class_created_once():
+    # GIVEN
+    provider = get_provider('tests.tstprovider_readonly', {})
+
+    # WHEN
+    other_provider = get_provider('tests.tstprovider_readonly', {}, use_cache=False)
+
+    # THEN
+    assert other_provider is not provider
+    assert type(other_provider) is type(provider)
@@ -15,12 +15,13 @@ import os
 import textwrap
 import warnings
 
+import iso8601
 import pytz
-from nose.tools import assert_is
 
 import shaystack
 from shaystack import MARKER, Grid, MODE_JSON, XStr, MODE_CSV, MODE_TRIO, Quantity, Coordinate, MODE_ZINC
-from shaystack.tools import unescape_str
+from shaystack import jsonparser
+from shaystack.tools import unescape_str, escape_str
 from shaystack.zincparser import ZincParseException
 
 # These are examples taken from http://project-haystack.org/doc/Zinc
@@ -285,7 +286,7 @@ def _check_na(grid):
         grid:
     """
     assert len(grid) == 1
-    assert_is(grid[0]['na'], shaystack.NA)
+    assert grid[0]['na'] is shaystack.NA
 
 
 def _check_remove(grid):
@@ -294,8 +295,8 @@ def _check_remove(grid):
         grid:
     """
     assert len(grid) == 2
-    assert_is(grid[0]['remove'], shaystack.REMOVE)
-    assert_is(grid[1]['remove'], shaystack.REMOVE)
+    assert grid[0]['remove'] is shaystack.REMOVE
+    assert grid[1]['remove'] is shaystack.REMOVE
 
 
 def _check_number(grid):
@@ -399,6 +400,45 @@ def test_simple_json():
     _check_simple(grid)
 
 
+def test_json_loads_fallback():
+    # The values refused by orjson are parsed by the standard json module
+    assert jsonparser._json_loads('[1, "a"]') == [1, "a"]
+    assert jsonparser._json_loads('[%d]' % (2 ** 70)) == [2 ** 70]
+    assert math.isnan(jsonparser._json_loads('NaN'))
+
+
+def test_interned_column_names():
+    # The tags of entities are the same objects as the column names
+    for grid_str, mode in ((SIMPLE_EXAMPLE_ZINC, MODE_ZINC),
+                           (json.dumps(SIMPLE_EXAMPLE_JSON), MODE_JSON),
+                           (SIMPLE_EXAMPLE_CSV, MODE_CSV)):
+        grid = shaystack.parse(grid_str, mode=mode)
+        for col_name in grid.column.keys():
+            for row in grid:
+                for tag in row.keys():
+                    if tag == col_name:
+                        assert tag is col_name
+
+
+def test_zinc_iso_date_time_same_as_iso8601():
+    for datetime_str in ['2021-01-01T12:30:45Z', '2021-01-01t12:30:45z', '2021-01-01T12:30',
+                         '2021-01-01T12:30:45.5+01:00', '2021-01-01T12:30:45.123-05:30',
+                         '2021-01-01T12:30:45+00:00', '2021-01-01T12:30:45.123456789Z']:
+        expected = iso8601.parse_date(datetime_str.upper())
+        value = shaystack.parse_scalar(datetime_str, MODE_ZINC)
+        assert value == expected
+        assert value.tzname() == expected.tzname()
+    assert shaystack.parse_scalar('12:30:45.1234', MODE_ZINC) == datetime.time(12, 30, 45, 123400)
+    assert shaystack.parse_scalar('2021-02-03', MODE_ZINC) == datetime.date(2021, 2, 3)
+
+
+def test_zinc_number_list():
+    assert shaystack.parse_scalar('[1, -2.5 ,3,]', MODE_ZINC) == [1.0, -2.5, 3.0]
+    assert shaystack.parse_scalar('[1,2kW]', MODE_ZINC) == [1.0, Quantity(2, 'kW')]
+    assert shaystack.parse_scalar('[1e3,1_0]', MODE_ZINC) == [1000.0, 10.0]
+    assert shaystack.parse_scalar('[[1,2],[3]]', MODE_ZINC) == [[1.0, 2.0], [3.0]]
+
+
 def test_simple_csv():
     grid = shaystack.parse(SIMPLE_EXAMPLE_CSV,
                            mode=shaystack.MODE_CSV)
@@ -602,7 +642,7 @@ def test_marker_in_row_zinc():
     ''')[1:])
     assert len(grid) == 2
     assert 'marker' not in grid[0]
-    assert_is(grid[1]['marker'], shaystack.MARKER)
+    assert grid[1]['marker'] is shaystack.MARKER
 
 
 def test_marker_in_row_trio():
@@ -614,7 +654,7 @@ def test_marker_in_row_trio():
     ''')[1:], MODE_TRIO)
     assert len(grid) == 2
     assert 'marker' not in grid[0]
-    assert_is(grid[1]['marker'], shaystack.MARKER)
+    assert grid[1]['marker'] is shaystack.MARKER
 
 
 def test_marker_in_row_json():
@@ -1343,8 +1383,8 @@ def test_list_v3_json():
     assert isinstance(lst, list)
     assert len(lst) == 4
     assert lst[0] == 'my list'
-    assert_is(lst[1], None)
-    assert_is(lst[2], True)
+    assert lst[1] is None
+    assert lst[2] is True
     assert lst[3] == 1234.0
 
 
@@ -1695,9 +1735,9 @@ def test_grid_meta_zinc():
                                  'aTimestamp', 'aPlace']
     assert meta['aString'] == 'aValue'
     assert meta['aNumber'] == 3.14159
-    assert_is(meta['aNull'], None)
-    assert_is(meta['aMarker'], shaystack.MARKER)
-    assert_is(meta['anotherMarker'], shaystack.MARKER)
+    assert meta['aNull'] is None
+    assert meta['aMarker'] is shaystack.MARKER
+    assert meta['anotherMarker'] is shaystack.MARKER
     assert isinstance(meta['aQuantity'], shaystack.Quantity)
     assert meta['aQuantity'].m == 123
     assert meta['aQuantity'].units == 'hertz'
@@ -1735,9 +1775,9 @@ def test_col_meta_zinc():
                                  'aTimestamp', 'aPlace']
     assert meta['aString'] == 'aValue'
     assert meta['aNumber'] == 3.14159
-    assert_is(meta['aNull'], None)
-    assert_is(meta['aMarker'], shaystack.MARKER)
-    assert_is(meta['anotherMarker'], shaystack.MARKER)
+    assert meta['aNull'] is None
+    assert meta['aMarker'] is shaystack.MARKER
+    assert meta['anotherMarker'] is shaystack.MARKER
     assert isinstance(meta['aQuantity'], shaystack.Quantity)
     assert meta['aQuantity'].m == 123
     assert meta['aQuantity'].units == 'hertz'
@@ -1789,7 +1829,7 @@ def test_nodehaystack_02_zinc():
     ''')[1:])
     assert len(grid) == 1
     assert list(grid.metadata.keys()) == ['tag', 'foo']
-    assert_is(grid.metadata['tag'], shaystack.MARKER)
+    assert grid.metadata['tag'] is shaystack.MARKER
     assert grid.metadata['foo'] == 'bar'
     assert list(grid.column.keys()) == ['xyz']
     assert grid[0]['xyz'] == 'val'
@@ -1860,8 +1900,8 @@ def test_nodehaystack_05_zinc():
     assert row['c'] == shaystack.Quantity(4, 's')
     assert row['d'] == shaystack.Quantity(-2.5, 'min')
     row = grid.pop(0)
-    assert_is(row['a'], shaystack.MARKER)
-    assert_is(row['b'], shaystack.REMOVE)
+    assert row['a'] is shaystack.MARKER
+    assert row['b'] is shaystack.REMOVE
     assert row['c'] == XStr('hex', '010203')
     assert row['d'] == XStr('hex', '010203')
     row = grid.pop(0)
@@ -1967,9 +2007,9 @@ def test_nodehaystack_09_zinc():
         datetime.datetime(2010, 2, 3, 4, 5, 6))
     assert grid.metadata['c'] == pytz.timezone('Europe/London').localize(
         datetime.datetime(2009, 12, 3, 4, 5, 6))
-    assert_is(grid.metadata['foo'], shaystack.MARKER)
-    assert_is(grid.metadata['bar'], shaystack.MARKER)
-    assert_is(grid.metadata['baz'], shaystack.MARKER)
+    assert grid.metadata['foo'] is shaystack.MARKER
+    assert grid.metadata['bar'] is shaystack.MARKER
+    assert grid.metadata['baz'] is shaystack.MARKER
     assert list(grid.column.keys()) == ['a']
     assert grid.pop(0)['a'] == 3.814697265625E-6
     assert grid.pop(0)['a'] == pytz.utc.localize(
@@ -1995,7 +2035,7 @@ def test_nodehaystack_10_zinc():
     assert len(grid) == 3
     assert list(grid.metadata.keys()) == ['bg', 'mark']
     assert grid.metadata['bg'] == shaystack.Bin('image/jpeg')
-    assert_is(grid.metadata['mark'], shaystack.MARKER)
+    assert grid.metadata['mark'] is shaystack.MARKER
     assert list(grid.column.keys()) == ['file1', 'file2']
     assert list(grid.column['file1'].keys()) == ['dis', 'icon']
     assert grid.column['file1']['dis'] == 'F1'
@@ -2346,6 +2386,11 @@ def test_unescape():
     assert unescape_str("a\\nb") == "a\nb"
 
 
+def test_escape():
+    assert escape_str('a\nb\t"c"\\ \u00e9') == 'a\\nb\\t\\"c\\"\\\\ \u00e9'
+    assert unescape_str(escape_str('a\b\f\r')) == 'a\b\f\r'
+
+
 def test_string_without_crlf_at_end():
     shaystack.parse(SIMPLE_EXAMPLE_ZINC[0:-1], MODE_ZINC)
     assert True  # No exception
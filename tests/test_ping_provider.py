@@ -11,6 +11,8 @@ def test_about():
     provider = get_provider("shaystack.providers.ping", {})
     result = provider.about("http://localhost")
     assert result[0]['moduleName'] == 'PingProvider'
+    assert result[0]['serverBootTime'] <= result[0]['serverTime']
+    assert provider.about("http://localhost")[0]['serverBootTime'] == result[0]['serverBootTime']
 
 
 def test_read():
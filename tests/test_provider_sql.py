@@ -2,8 +2,8 @@ import datetime
 from typing import cast
 
 import psycopg2
+import pytest
 import pytz
-from nose import SkipTest
 
 from shaystack import Ref, Grid
 from shaystack.providers import get_provider
@@ -17,7 +17,7 @@ FAKE_NOW = datetime.datetime(2020, 10, 1, 0, 0, 0, 0, tzinfo=pytz.UTC)
 
 
 def skip(msg: str) -> None:
-    raise SkipTest(msg)
+    pytest.skip(msg)
 
 
 def test_create_db():
@@ -26,8 +26,8 @@ def test_create_db():
         with cast(SQLProvider, get_provider("shaystack.providers.sql", envs,
                                             use_cache=False)) as provider:
             provider.create_db()
-    except psycopg2.OperationalError as ex:
-        raise SkipTest("Postgres db not started") from ex
+    except psycopg2.OperationalError:
+        pytest.skip("Postgres db not started")
 
 
 def test_update_grid():
@@ -42,8 +42,8 @@ def test_update_grid():
             grid.append({"id": Ref("1"), "a": "a", "b": "b"})
             grid.append({"id": Ref("2"), "a": "c", "b": "d"})
             provider.update_grid(grid, None, "customer", FAKE_NOW)
-    except psycopg2.OperationalError as ex:
-        raise SkipTest("Postgres db not started") from ex
+    except psycopg2.OperationalError:
+        pytest.skip("Postgres db not started")
 
 
 def test_about():
@@ -53,5 +53,5 @@ def test_about():
                           use_cache=False) as provider:
             result = provider.about("http://localhost")
             assert result[0]['moduleName'] == 'SQLProvider'
-    except psycopg2.OperationalError as ex:
-        raise SkipTest("Postgres db not started") from ex
+    except psycopg2.OperationalError:
+        pytest.skip("Postgres db not started")
@@ -116,3 +116,8 @@ def test_date_range_date_limit():
     date_min, date_max = parse_date_range("0001-01-01,9999-12-31", _TZ_PARIS)
     assert date_min == _DATETIME_MIN_TZ
     assert date_max == _DATETIME_MAX_TZ
+
+
+def test_date_range_today_cached():
+    assert parse_date_range("today", _TZ_PARIS) is parse_date_range("today", _TZ_PARIS)
+    assert parse_date_range("yesterday", _TZ_PARIS)[1] == parse_date_range("today", _TZ_PARIS)[0]
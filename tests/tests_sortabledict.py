@@ -179,3 +179,10 @@ def test_pop_at():
     a_dict['c'] = 3
     assert a_dict.pop_at(1) == 2
     assert list(a_dict.items()) == [('a', 1), ('c', 3)]
+
+
+def test_bulk_load():
+    a_dict = SortableDict()
+    a_dict['b'] = 1
+    a_dict.bulk_load([('a', 2), ('b', 3), ('c', 4), ('a', 5)])
+    assert list(a_dict.items()) == [('b', 3), ('a', 5), ('c', 4)]